@@ -5,29 +5,48 @@ H3 Syllable System - Build Script
 Builds both Python and JavaScript packages with shared configurations.
 """
 
+import shutil
 import sys
 import subprocess
 from pathlib import Path
 
-def run_command(cmd, cwd=None):
-    """Run a command and return success status."""
+ROOT_DIR = Path(__file__).resolve().parent
+PYTHON_DIR = ROOT_DIR / "packages" / "python"
+JS_DIR = ROOT_DIR / "packages" / "javascript"
+
+def run_command(args, cwd=None, label=None):
+    """
+    Run a command given as an argv list, streaming its output, and return success status.
+    
+    Streamed lines are prefixed with the label, so each build's output stays identifiable.
+    """
+    prefix = f"[{label}] " if label else ""
+    cmd = " ".join(args)
+    # Resolve launchers such as npm.cmd on Windows, which need no shell this way
+    executable = shutil.which(args[0]) or args[0]
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Command failed: {cmd}")
-        print(f"Error: {e.stderr}")
+        proc = subprocess.Popen([executable, *args[1:]], cwd=cwd, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, bufsize=1)
+    except OSError as e:
+        print(f"{prefix}❌ Command failed: {cmd}\nError: {e}")
+        return False
+    
+    # Forward output line by line instead of buffering the whole log
+    with proc.stdout:
+        for line in proc.stdout:
+            print(prefix + line, end="")
+    
+    if proc.wait() != 0:
+        print(f"{prefix}❌ Command failed: {cmd} (exit code {proc.returncode})")
         return False
+    return True
 
 def build_python():
     """Build Python package."""
     print("🐍 Building Python package...")
     
-    python_dir = Path(__file__).parent / "packages" / "python"
-    
     # Run the Python build script
-    if not run_command("python scripts/build.py", cwd=python_dir):
+    if not run_command(["python", "scripts/build.py"], cwd=PYTHON_DIR, label="python"):
         return False
     
     print("✅ Python package built successfully!")
@@ -37,14 +56,12 @@ def build_javascript():
     """Build JavaScript package."""
     print("🟨 Building JavaScript package...")
     
-    js_dir = Path(__file__).parent / "packages" / "javascript"
-    
     # Install dependencies
-    if not run_command("npm install", cwd=js_dir):
+    if not run_command(["npm", "install"], cwd=JS_DIR, label="javascript"):
         return False
     
     # Build package (this will also export configs)
-    if not run_command("npm run build", cwd=js_dir):
+    if not run_command(["npm", "run", "build"], cwd=JS_DIR, label="javascript"):
         return False
     
     print("✅ JavaScript package built successfully!")
@@ -54,7 +71,8 @@ def main():
     """Main build function."""
     print("🚀 Building H3 Syllable System packages...")
     
-    # Build both packages
+    # Build both packages one after the other: the JavaScript build (and the
+    # prepare hook of npm install) re-exports configs into the Python package
     python_success = build_python()
     js_success = build_javascript()
     
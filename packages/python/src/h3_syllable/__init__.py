@@ -50,10 +50,13 @@ from .h3_syllable_system import (
     analyze_address,
     coordinate_to_address,
     estimate_location_from_partial,
+    estimate_locations_from_partials,
     get_config_info,
     is_valid_address,
     list_available_configs,
     address_to_coordinate,
+    coordinates_to_addresses,
+    addresses_to_coordinates,
 )
 from .utilities import (
     calculate_distance,
@@ -86,8 +89,11 @@ __all__ = [
     # Convenience functions
     "coordinate_to_address",
     "address_to_coordinate",
+    "coordinates_to_addresses",
+    "addresses_to_coordinates",
     "is_valid_address",
     "estimate_location_from_partial",
+    "estimate_locations_from_partials",
     "analyze_address",
     # Configuration functions
     "get_config",
@@ -8,8 +8,8 @@ Provides a simple CLI tool for converting coordinates to syllable addresses.
 import argparse
 import sys
 
-from .config_loader import list_configs
-from .h3_syllable_system import H3SyllableSystem, is_valid_address
+from .config_loader import get_config, list_configs
+from .h3_syllable_system import H3SyllableSystem
 
 
 def main() -> None:
@@ -67,9 +67,9 @@ Examples:
     try:
         if args.command == "configs":
             print("Available configurations:")
+            # Descriptions come from the config alone; no need to build a system
             for config_name in sorted(list_configs()):
-                system = H3SyllableSystem(config_name)
-                print(f"  {config_name:20} - {system.config.description}")
+                print(f"  {config_name:20} - {get_config(config_name).description}")
 
         elif args.command == "coordinate":
             system = H3SyllableSystem(args.config)
@@ -86,12 +86,12 @@ Examples:
             print(f"Config:     {args.config}")
 
         elif args.command == "validate":
-            is_valid = is_valid_address(args.address, args.config)
+            system = H3SyllableSystem(args.config)
+            is_valid = system.is_valid_address(args.address)
             status = "✅ VALID" if is_valid else "❌ INVALID"
             print(f"Address: {args.address}")
             print(f"Status:  {status}")
             if is_valid:
-                system = H3SyllableSystem(args.config)
                 lat, lon = system.address_to_coordinate(args.address)
                 print(f"Location: {lat:.6f}, {lon:.6f}")
             else:
@@ -146,8 +146,8 @@ class ConfigLoader:
         self.config_dir.mkdir(exist_ok=True)
         filepath = self.config_dir / f"{config_name}.json"
 
-        with open(filepath, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        # Serialize up front and write in one call
+        filepath.write_text(json.dumps(config_dict, indent=2))
 
     def list_auto_generated_configs(self) -> List[str]:
         """List all auto-generated configuration names."""
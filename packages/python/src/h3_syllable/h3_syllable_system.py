@@ -20,7 +20,9 @@ Features:
 """
 
 import math
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
 from typing import Dict, List, Tuple, Union
 
 import h3
@@ -92,7 +94,35 @@ class SystemInfo:
     precision_meters: float
 
 
-@dataclass
+def _slotted(cls):
+    """
+    Rebuild a frozen dataclass with __slots__, as dataclass(slots=True) does
+    on Python 3.10+.
+
+    Field defaults live in the generated __init__, so the class attributes
+    holding them are dropped to make room for the slots. Pickle and copy
+    restore state through object.__setattr__, bypassing the frozen __setattr__.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = field_names
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in field_names)
+
+    def __setstate__(self, state):
+        for name, value in zip(field_names, state):
+            object.__setattr__(self, name, value)
+
+    namespace['__getstate__'] = __getstate__
+    namespace['__setstate__'] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
+@dataclass(frozen=True)
 class GeographicBounds:
     """Geographic bounds."""
     
@@ -102,7 +132,8 @@ class GeographicBounds:
     west: float
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class PartialLocationEstimate:
     """Result from partial address location estimation."""
     
@@ -202,6 +233,8 @@ class H3SyllableSystem:
         # Cache for performance (with size limit)
         self._cache = {}
         self._cache_max_size = 1000
+        self._cache_lock = threading.Lock()
+        self._partial_cache = {}
 
         # Load level 0 mapping for Hamiltonian path ordering
         self._level_0_mapping = self._load_level_0_mapping()
@@ -219,6 +252,9 @@ class H3SyllableSystem:
                 self.index_to_syllable[index] = syllable
                 index += 1
 
+        # Syllables in lexicographic order (used for address range padding)
+        self.sorted_syllables = sorted(self.syllable_to_index.keys())
+
     def _load_level_0_mapping(self) -> List[int]:
         """Load level 0 Hamiltonian path mapping (optimized array-based approach)."""
         # Pre-computed Hamiltonian path for perfect spatial adjacency (100%)
@@ -374,8 +410,9 @@ class H3SyllableSystem:
 
             # Check cache
             coord_key = (round(latitude, 8), round(longitude, 8))
-            if coord_key in self._cache:
-                return self._cache[coord_key]
+            cached = self._cache.get(coord_key)
+            if cached is not None:
+                return cached
 
             # Step 1: Convert GPS Coordinates to H3 Cell ID
             h3_index = h3.latlng_to_cell(latitude, longitude, self.h3_resolution)
@@ -392,10 +429,7 @@ class H3SyllableSystem:
             syllable_address = self._integer_index_to_syllable_address(integer_index)
 
             # Cache result (with size limit)
-            if len(self._cache) >= self._cache_max_size:
-                # Remove oldest entry (simple FIFO)
-                self._cache.pop(next(iter(self._cache)))
-            self._cache[coord_key] = syllable_address
+            self._cache_store(self._cache, coord_key, syllable_address)
 
             return syllable_address
 
@@ -424,8 +458,9 @@ class H3SyllableSystem:
         """
         try:
             # Check cache
-            if syllable_address in self._cache:
-                return self._cache[syllable_address]
+            cached = self._cache.get(syllable_address)
+            if cached is not None:
+                return cached
 
             # Step 1: Convert Syllable Address to Integer Index
             integer_index = self._syllable_address_to_integer_index(syllable_address)
@@ -442,10 +477,7 @@ class H3SyllableSystem:
             latitude, longitude = h3.cell_to_latlng(h3_index)
 
             # Cache result (with size limit)
-            if len(self._cache) >= self._cache_max_size:
-                # Remove oldest entry (simple FIFO)
-                self._cache.pop(next(iter(self._cache)))
-            self._cache[syllable_address] = (latitude, longitude)
+            self._cache_store(self._cache, syllable_address, (latitude, longitude))
 
             return latitude, longitude
 
@@ -454,6 +486,76 @@ class H3SyllableSystem:
         except Exception:
             raise ConversionError("Syllable conversion failed")
 
+    def coordinates_to_addresses(self, coordinates: List[Tuple[float, float]]) -> List[str]:
+        """
+        Convert several geographic coordinates to syllable addresses at once.
+
+        The conversion steps are resolved once for the whole batch and the
+        per-call cache is bypassed, so this is cheaper than repeated
+        coordinate_to_address calls for large inputs.
+
+        Args:
+            coordinates: Sequence of (latitude, longitude) pairs
+
+        Returns:
+            List of syllable addresses, in the same order as the input
+
+        Raises:
+            ConversionError: If any conversion fails
+
+        Example:
+            >>> system = H3SyllableSystem()
+            >>> system.coordinates_to_addresses([(48.8566, 2.3522), (40.7128, -74.0060)])
+        """
+        validate = self._validate_coordinates
+        latlng_to_cell = h3.latlng_to_cell
+        resolution = self.h3_resolution
+        to_array = self._h3_cell_id_to_hierarchical_array
+        to_index = self._hierarchical_array_to_integer_index
+        to_address = self._integer_index_to_syllable_address
+
+        addresses = []
+        for latitude, longitude in coordinates:
+            try:
+                validate(latitude, longitude)
+                h3_index = latlng_to_cell(latitude, longitude, resolution)
+                addresses.append(to_address(to_index(to_array(h3_index))))
+            except ValueError:
+                raise ConversionError(f"Invalid coordinate values: {latitude}, {longitude}")
+            except Exception:
+                raise ConversionError("Coordinate conversion failed")
+
+        return addresses
+
+    def addresses_to_coordinates(self, syllable_addresses: List[str]) -> List[Tuple[float, float]]:
+        """
+        Convert several syllable addresses to geographic coordinates at once.
+
+        Args:
+            syllable_addresses: Sequence of syllable address strings
+
+        Returns:
+            List of (latitude, longitude) tuples, in the same order as the input
+
+        Raises:
+            ConversionError: If any conversion fails
+        """
+        to_index = self._syllable_address_to_integer_index
+        to_array = self._integer_index_to_hierarchical_array
+        to_cell = self._hierarchical_array_to_h3_cell_id
+        cell_to_latlng = h3.cell_to_latlng
+
+        coordinates = []
+        for syllable_address in syllable_addresses:
+            try:
+                coordinates.append(cell_to_latlng(to_cell(to_array(to_index(syllable_address)))))
+            except ValueError:
+                raise ConversionError("Invalid syllable address format")
+            except Exception:
+                raise ConversionError("Syllable conversion failed")
+
+        return coordinates
+
     def _validate_coordinates(self, latitude: float, longitude: float):
         """Validate coordinate ranges."""
         # Check for invalid numbers
@@ -674,9 +776,9 @@ class H3SyllableSystem:
             meters_per_degree_lat = 111320
             meters_per_degree_lon = 111320 * math.cos(lat_rad)
 
-            distance_error_m = math.sqrt(
-                (lat_diff * meters_per_degree_lat) ** 2
-                + (lon_diff * meters_per_degree_lon) ** 2
+            distance_error_m = math.hypot(
+                lat_diff * meters_per_degree_lat,
+                lon_diff * meters_per_degree_lon,
             )
 
             return {
@@ -725,7 +827,11 @@ class H3SyllableSystem:
         """
         if detailed:
             return self._validate_address(syllable_address)
-        
+
+        # Reject malformed addresses up front, without raising
+        if not self._has_known_syllables(syllable_address):
+            return False
+
         try:
             # Attempt conversion - if it succeeds, address is valid
             self.address_to_coordinate(syllable_address)
@@ -734,6 +840,18 @@ class H3SyllableSystem:
             # Any conversion error means the address doesn't exist
             return False
 
+    def _has_known_syllables(self, syllable_address: str) -> bool:
+        """Check that an address has the configured length and only known syllables."""
+        if not isinstance(syllable_address, str):
+            return False
+
+        clean_address = syllable_address.lower()
+        if len(clean_address) != 2 * self.address_length:
+            return False
+
+        syllable_to_index = self.syllable_to_index
+        return all(clean_address[i:i + 2] in syllable_to_index for i in range(0, len(clean_address), 2))
+
     def _validate_address(self, syllable_address: str) -> dict:
         """
         Comprehensive validation with detailed error reporting.
@@ -885,7 +1003,7 @@ class H3SyllableSystem:
 
         # Add general suggestions for valid syllables
         if errors:
-            all_syllables = sorted(self.syllable_to_index.keys())
+            all_syllables = self.sorted_syllables
             suggestions.extend([
                 f'Valid syllables: {", ".join(all_syllables[:10])}...',
                 f'Consonants: {", ".join(self.consonants)}',
@@ -1114,6 +1232,12 @@ class H3SyllableSystem:
             >>> print(f"Area: {estimate.estimated_area_km2:.1f} km²")
         """
         try:
+            # Unhashable arguments fail here and surface as ConversionError
+            cache_key = (partial_address, comprehensive)
+            cached = self._partial_cache.get(cache_key)
+            if cached is not None:
+                return self._copy_estimate(cached)
+
             # Parse partial address and validate format
             parsed = self._parse_partial_address(partial_address)
             
@@ -1155,7 +1279,7 @@ class H3SyllableSystem:
             # Calculate completeness level
             completeness_level = len(parsed['complete_syllables']) + (0.5 if parsed['partial_consonant'] else 0)
             
-            return PartialLocationEstimate(
+            estimate = PartialLocationEstimate(
                 center_coordinate=center,
                 bounds=bounds,
                 confidence=confidence,
@@ -1165,14 +1289,40 @@ class H3SyllableSystem:
                 sample_points=sample_points if comprehensive else None,
                 comprehensive_mode=comprehensive
             )
+
+            # Cache result (prefixes are re-estimated as users type)
+            self._cache_store(self._partial_cache, cache_key, estimate)
+
+            return self._copy_estimate(estimate)
         except Exception as e:
             if isinstance(e, ConversionError):
                 raise e
             raise ConversionError(f"Partial address estimation failed: {str(e)}")
 
+    def _cache_store(self, cache: Dict, key, value):
+        """Store a cache entry, evicting the oldest one (FIFO) when full.
+
+        Instances are shared across threads through _get_system, so eviction
+        and insertion happen under a lock.
+        """
+        with self._cache_lock:
+            if len(cache) >= self._cache_max_size:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = value
+
+    @staticmethod
+    def _copy_estimate(estimate: PartialLocationEstimate) -> PartialLocationEstimate:
+        """Copy a cached estimate, giving the caller its own mutable lists."""
+        return replace(
+            estimate,
+            suggested_refinements=list(estimate.suggested_refinements),
+            sample_points=None if estimate.sample_points is None else list(estimate.sample_points),
+        )
+
     def clear_cache(self):
-        """Clear internal cache."""
+        """Clear internal caches."""
         self._cache.clear()
+        self._partial_cache.clear()
 
     def get_config_info(self) -> Dict:
         """Get detailed information about the current configuration."""
@@ -1324,7 +1474,7 @@ class H3SyllableSystem:
 
     def _get_min_max_syllables(self) -> Dict[str, str]:
         """Get the minimum and maximum syllables for the current config."""
-        syllables = sorted(self.syllable_to_index.keys())
+        syllables = self.sorted_syllables
         return {
             "min_syllable": syllables[0],
             "max_syllable": syllables[-1]
@@ -1391,7 +1541,7 @@ class H3SyllableSystem:
             return sorted([partial_consonant + vowel for vowel in self.vowels])
         else:
             # For complete syllables, suggest all available syllables as potential next options
-            return sorted(self.syllable_to_index.keys())
+            return list(self.sorted_syllables)
 
     def _find_valid_address_range(self, min_address: str, max_address: str, partial_syllables: List[str]) -> Dict[str, str]:
         """Find valid address range with smart fallback when min/max addresses are invalid."""
@@ -1443,7 +1593,7 @@ class H3SyllableSystem:
         # Parse 2-character syllables from concatenated string
         clean_address = address.lower()
         syllables = [clean_address[i:i+2] for i in range(0, len(clean_address), 2)]
-        all_syllables = sorted(self.syllable_to_index.keys())
+        all_syllables = self.sorted_syllables
         partial_length = len(partial_syllables)
         
         # Start incrementing from the first syllable after the partial prefix
@@ -1469,7 +1619,7 @@ class H3SyllableSystem:
         # Parse 2-character syllables from concatenated string
         clean_address = address.lower()
         syllables = [clean_address[i:i+2] for i in range(0, len(clean_address), 2)]
-        all_syllables = sorted(self.syllable_to_index.keys())
+        all_syllables = self.sorted_syllables
         partial_length = len(partial_syllables)
         
         # Start decrementing from the first syllable after the partial prefix
@@ -1574,6 +1724,12 @@ class H3SyllableSystem:
         return (avg_lat, avg_lon)
 
 
+@lru_cache(maxsize=8)
+def _get_system(config_name: str = None) -> H3SyllableSystem:
+    """Get a shared system instance for a configuration, built once per config."""
+    return H3SyllableSystem(config_name)
+
+
 # Convenience functions for quick usage
 def coordinate_to_address(
     latitude: float,
@@ -1582,7 +1738,7 @@ def coordinate_to_address(
     letters: List[str] = None,
 ) -> str:
     """Convert coordinates to syllable address using specified configuration."""
-    system = H3SyllableSystem(config_name=config_name)
+    system = _get_system(config_name)
     return system.coordinate_to_address(latitude, longitude)
 
 
@@ -1590,10 +1746,24 @@ def address_to_coordinate(
     syllable_address: str, config_name: str = None, letters: List[str] = None
 ) -> Tuple[float, float]:
     """Convert syllable address to coordinates using specified configuration."""
-    system = H3SyllableSystem(config_name=config_name)
+    system = _get_system(config_name)
     return system.address_to_coordinate(syllable_address)
 
 
+def coordinates_to_addresses(
+    coordinates: List[Tuple[float, float]], config_name: str = None
+) -> List[str]:
+    """Convert several coordinates to syllable addresses using specified configuration."""
+    return _get_system(config_name).coordinates_to_addresses(coordinates)
+
+
+def addresses_to_coordinates(
+    syllable_addresses: List[str], config_name: str = None
+) -> List[Tuple[float, float]]:
+    """Convert several syllable addresses to coordinates using specified configuration."""
+    return _get_system(config_name).addresses_to_coordinates(syllable_addresses)
+
+
 def is_valid_address(syllable_address: str, config_name: str = None) -> bool:
     """
     Check if syllable address corresponds to a real location.
@@ -1617,7 +1787,7 @@ def is_valid_address(syllable_address: str, config_name: str = None) -> bool:
     if config_name is None:
         config_name = "ascii-dnqqwn"
     
-    system = H3SyllableSystem(config_name)
+    system = _get_system(config_name)
     return system.is_valid_address(syllable_address)
 
 
@@ -1643,10 +1813,32 @@ def estimate_location_from_partial(partial_address: str, config_name: str = None
         >>> print(f"Center: {estimate.center_coordinate}")
         >>> print(f"Area: {estimate.estimated_area_km2:.1f} km²")
     """
-    system = H3SyllableSystem(config_name)
+    system = _get_system(config_name)
     return system.estimate_location_from_partial(partial_address, comprehensive)
 
 
+def estimate_locations_from_partials(partial_addresses: List[str], config_name: str = None, comprehensive: bool = False) -> List[PartialLocationEstimate]:
+    """
+    Estimate locations for several partial syllable addresses at once.
+
+    The system for the configuration is resolved once and reused for every
+    partial address, so this is cheaper than repeated single calls.
+
+    Args:
+        partial_addresses: Partial syllable addresses (e.g., ["da", "dafe"])
+        config_name: Configuration to use for estimation
+
+    Returns:
+        List of PartialLocationEstimate, in the same order as the input
+
+    Example:
+        >>> estimates = estimate_locations_from_partials(["da", "dafe", "dafehe"])
+        >>> print([round(e.estimated_area_km2) for e in estimates])
+    """
+    estimate = _get_system(config_name).estimate_location_from_partial
+    return [estimate(partial_address, comprehensive) for partial_address in partial_addresses]
+
+
 def analyze_address(syllable_address: str, config_name: str = None) -> AddressAnalysis:
     """
     Analyze a syllable address and provide phonetic alternatives.
@@ -1669,7 +1861,7 @@ def analyze_address(syllable_address: str, config_name: str = None) -> AddressAn
         >>> for alt in analysis.phonetic_alternatives:
         ...     print(f"{alt.address} ({alt.distance_km}km away)")
     """
-    system = H3SyllableSystem(config_name)
+    system = _get_system(config_name)
     return system.analyze_address(syllable_address)
 
 
@@ -5,7 +5,7 @@ Utility functions for H3 Syllable System
 
 import math
 from typing import List, Tuple, Dict, Any
-from .h3_syllable_system import H3SyllableSystem
+from .h3_syllable_system import _get_system
 
 
 def calculate_distance(
@@ -32,7 +32,7 @@ def calculate_distance(
         ... )
         >>> print(f"Distance: {distance:.2f} km")
     """
-    system = H3SyllableSystem(config_name)
+    system = _get_system(config_name)
     lat1, lon1 = system.address_to_coordinate(address1)
     lat2, lon2 = system.address_to_coordinate(address2)
     
@@ -60,7 +60,7 @@ def find_nearby_addresses(
         >>> for item in nearby:
         ...     print(f"{item['address']}: {item['distance']:.3f}km")
     """
-    system = H3SyllableSystem(config_name)
+    system = _get_system(config_name)
     center_lat, center_lon = system.address_to_coordinate(center_address)
     
     # Generate grid of nearby coordinates to find addresses within radius
@@ -73,13 +73,17 @@ def find_nearby_addresses(
     lon_start = center_lon - grid_size
     lon_end = center_lon + grid_size
     
+    # Latitude cosines are fixed for the center and for each grid row
+    cos_center = math.cos(math.radians(center_lat))
+    
     lat = lat_start
     while lat <= lat_end:
+        cos_lat = math.cos(math.radians(lat))
         lon = lon_start
         while lon <= lon_end:
             try:
                 address = system.coordinate_to_address(lat, lon)
-                distance = haversine_distance(center_lat, center_lon, lat, lon)
+                distance = _haversine_with_cosines(center_lat, center_lon, cos_center, lat, lon, cos_lat)
                 
                 if distance <= radius_km and address != center_address:
                     # Check if we already have this address
@@ -117,19 +121,20 @@ def get_address_bounds(
         >>> print(f"SW: {bounds['south']}, {bounds['west']}")
         >>> print(f"NE: {bounds['north']}, {bounds['east']}")
     """
-    system = H3SyllableSystem(config_name)
+    system = _get_system(config_name)
     center_lat, center_lon = system.address_to_coordinate(address)
     
     # H3 level 15 has ~0.5m precision, so create approximate bounds
     # Each H3 cell is roughly hexagonal with ~0.5m radius
     cell_radius_km = 0.0005  # ~0.5m in km
     degree_offset = cell_radius_km / 111  # Convert km to approximate degrees
+    lon_offset = degree_offset / math.cos(math.radians(center_lat))
     
     return {
         'north': center_lat + degree_offset,
         'south': center_lat - degree_offset,
-        'east': center_lon + degree_offset / math.cos(math.radians(center_lat)),
-        'west': center_lon - degree_offset / math.cos(math.radians(center_lat))
+        'east': center_lon + lon_offset,
+        'west': center_lon - lon_offset
     }
 
 
@@ -157,12 +162,12 @@ def cluster_addresses(
     if not addresses:
         return []
     
-    system = H3SyllableSystem(config_name)
+    system = _get_system(config_name)
     coords = []
     
     for addr in addresses:
         lat, lon = system.address_to_coordinate(addr)
-        coords.append({'address': addr, 'lat': lat, 'lon': lon})
+        coords.append({'address': addr, 'lat': lat, 'lon': lon, 'cos_lat': math.cos(math.radians(lat))})
     
     clusters = []
     used = set()
@@ -181,9 +186,9 @@ def cluster_addresses(
             if j in used:
                 continue
             
-            distance = haversine_distance(
-                coord1['lat'], coord1['lon'],
-                coord2['lat'], coord2['lon']
+            distance = _haversine_with_cosines(
+                coord1['lat'], coord1['lon'], coord1['cos_lat'],
+                coord2['lat'], coord2['lon'], coord2['cos_lat']
             )
             
             if distance <= max_distance_km:
@@ -226,12 +231,21 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in kilometers
     """
+    return _haversine_with_cosines(
+        lat1, lon1, math.cos(math.radians(lat1)),
+        lat2, lon2, math.cos(math.radians(lat2))
+    )
+
+
+def _haversine_with_cosines(lat1: float, lon1: float, cos_lat1: float,
+                            lat2: float, lon2: float, cos_lat2: float) -> float:
+    """Haversine distance in kilometers, with each latitude's cosine precomputed by the caller."""
     R = 6371  # Earth's radius in kilometers
     d_lat = math.radians(lat2 - lat1)
     d_lon = math.radians(lon2 - lon1)
     
     a = (math.sin(d_lat / 2) * math.sin(d_lat / 2) +
-         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
+         cos_lat1 * cos_lat2 *
          math.sin(d_lon / 2) * math.sin(d_lon / 2))
     
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
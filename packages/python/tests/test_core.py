@@ -5,12 +5,16 @@ Core functionality tests for H3 Syllable System
 
 import pytest
 import math
+from concurrent.futures import ThreadPoolExecutor
 from h3_syllable import (
     coordinate_to_address,
     address_to_coordinate, 
+    coordinates_to_addresses,
+    addresses_to_coordinates,
     H3SyllableSystem,
     list_available_configs,
-    get_config_info
+    get_config_info,
+    ConversionError
 )
 
 
@@ -267,6 +271,17 @@ class TestPerformance:
         assert len(addresses) == 100
         assert len(coords) == 100
     
+    def test_batch_conversion_matches_single(self):
+        """Test batch conversion agrees with single conversions"""
+        test_coords = [(48.8566, 2.3522), (40.7128, -74.0060), (-33.8688, 151.2093), (0.0, 0.0)]
+        
+        addresses = coordinates_to_addresses(test_coords)
+        assert addresses == [coordinate_to_address(lat, lon) for lat, lon in test_coords]
+        assert addresses_to_coordinates(addresses) == [address_to_coordinate(addr) for addr in addresses]
+        
+        with pytest.raises(ConversionError):
+            coordinates_to_addresses([(48.8566, 2.3522), (91, 0)])
+    
     def test_caching_performance(self):
         """Test that caching improves performance"""
         system = H3SyllableSystem()
@@ -279,6 +294,19 @@ class TestPerformance:
         address2 = system.coordinate_to_address(*coords)
         
         assert address1 == address2
+    
+    def test_shared_cache_is_thread_safe(self):
+        """Test concurrent conversions through the shared, evicting cache"""
+        coords = [(i * 0.001, i * 0.002) for i in range(2500)]
+        expected = coordinates_to_addresses(coords, 'ascii-dnqqwn')
+        
+        def convert(offset):
+            rotated = coords[offset:] + coords[:offset]
+            return [coordinate_to_address(lat, lon, 'ascii-dnqqwn') for lat, lon in rotated], offset
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for addresses, offset in executor.map(convert, range(0, 2500, 300)):
+                assert addresses == expected[offset:] + expected[:offset]
 
 
 class TestErrorHandling:
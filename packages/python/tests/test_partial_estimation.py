@@ -5,9 +5,12 @@ Test script for partial address estimation functionality
 
 import sys
 import os
+import copy
+import pickle
+import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from h3_syllable import estimate_location_from_partial, H3SyllableSystem, coordinate_to_address
+from h3_syllable import estimate_location_from_partial, estimate_locations_from_partials, H3SyllableSystem, ConversionError, coordinate_to_address, haversine_distance
 
 def test_basic_functionality():
     """Test basic partial address estimation"""
@@ -55,48 +58,79 @@ def test_completeness_levels():
         {'partial': 'dafeheho', 'expected': 4}
     ]
     
-    previous_area = float('inf')
-    previous_confidence = 0
+    results = estimate_locations_from_partials([test['partial'] for test in tests], config_name)
     
-    for test in tests:
-        result = estimate_location_from_partial(test['partial'], config_name)
+    for test, result in zip(tests, results):
         assert result.completeness_level == test['expected']
-        
-        # More complete addresses should have higher confidence and smaller areas
-        assert result.confidence > previous_confidence
-        assert result.estimated_area_km2 < previous_area
-        
-        previous_area = result.estimated_area_km2
-        previous_confidence = result.confidence
-        
         print(f"   ✅ '{test['partial']}': completeness {result.completeness_level}, confidence {result.confidence:.3f}, area {result.estimated_area_km2:.1f} km²")
+    
+    # More complete addresses should have higher confidence and smaller areas
+    confidences = [result.confidence for result in results]
+    areas = [result.estimated_area_km2 for result in results]
+    assert all(current > previous for previous, current in zip(confidences, confidences[1:]))
+    assert all(current < previous for previous, current in zip(areas, areas[1:]))
+
+def test_repeated_prefix_estimates():
+    """Test that repeated prefix estimates are served from the cache"""
+    print("\n🧪 Testing repeated prefix estimates...")
+    
+    system = H3SyllableSystem('ascii-dnqqwn')
+    prefixes = ['da', 'dafe', 'dafehe', 'dafeheho']
+    
+    first_pass = [system.estimate_location_from_partial(p) for p in prefixes]
+    second_pass = [system.estimate_location_from_partial(p) for p in prefixes]
+    
+    for prefix, first, second in zip(prefixes, first_pass, second_pass):
+        assert first == second, f"Expected equal cached estimate for '{prefix}'"
+    
+    # Mutating a returned estimate must not leak into later cached results
+    expected = list(first_pass[1].suggested_refinements)
+    first_pass[1].suggested_refinements.clear()
+    assert system.estimate_location_from_partial('dafe').suggested_refinements == expected
+    
+    comprehensive = system.estimate_location_from_partial('dafe', comprehensive=True)
+    expected_points = list(comprehensive.sample_points)
+    comprehensive.sample_points.append((0.0, 0.0))
+    assert system.estimate_location_from_partial('dafe', comprehensive=True).sample_points == expected_points
+    
+    # Clearing the cache forces a fresh (but equal) estimate
+    system.clear_cache()
+    assert system.estimate_location_from_partial('dafe') == second_pass[1]
+    
+    print(f"   ✅ {len(prefixes)} prefixes reused from cache")
+
+def test_estimate_pickle_and_copy():
+    """Test that estimates survive pickling and copying (e.g. across process pools)"""
+    print("\n🧪 Testing estimate pickle and copy round trips...")
+    
+    estimate = estimate_location_from_partial('dafe', 'ascii-dnqqwn')
+    
+    for value in (estimate, estimate.bounds):
+        assert not hasattr(value, '__dict__'), "Expected slotted instances"
+        assert pickle.loads(pickle.dumps(value)) == value
+        assert copy.copy(value) == value
+        assert copy.deepcopy(value) == value
+    
+    print("   ✅ Estimate and bounds round-trip through pickle and copy")
 
 def test_error_handling():
     """Test error handling"""
     print("\n🧪 Testing error handling...")
     
-    config_name = 'ascii-dnqqwn'
-    
-    # Empty partial address
-    try:
-        estimate_location_from_partial('', config_name)
-        assert False, "Should have thrown error for empty address"
-    except Exception:
-        print("   ✅ Empty address error handling works")
-    
-    # Invalid syllable
-    try:
-        estimate_location_from_partial('xx-yy', config_name)
-        assert False, "Should have thrown error for invalid syllable"
-    except Exception:
-        print("   ✅ Invalid syllable error handling works")
+    # One system shared across all invalid inputs
+    system = H3SyllableSystem('ascii-dnqqwn')
+    invalid_partials = [
+        ('', "Empty address"),
+        ('xx-yy', "Invalid syllable"),
+        # Too long address (equal to max length - international standard has 8 syllables)
+        ('dafehehodafeheho', "Complete address"),
+        (['da', 'fe'], "Unhashable argument"),
+    ]
     
-    # Too long address (equal to max length - international standard has 8 syllables)
-    try:
-        estimate_location_from_partial('dafehehodafeheho', config_name)
-        assert False, "Should have thrown error for complete address"
-    except Exception:
-        print("   ✅ Complete address error handling works")
+    for partial, description in invalid_partials:
+        with pytest.raises(ConversionError):
+            system.estimate_location_from_partial(partial)
+        print(f"   ✅ {description} error handling works")
 
 def test_consistency_with_real_addresses():
     """Test consistency with real addresses"""
@@ -108,24 +142,29 @@ def test_consistency_with_real_addresses():
     
     # Get full address
     full_address = coordinate_to_address(lat, lon, config_name)
-    # Parse 2-character syllables from concatenated string
-    parts = [full_address[i:i+2] for i in range(0, len(full_address), 2)]
+    # Addresses are concatenated 2-character syllables
+    syllable_count = len(full_address) // 2
     
     print(f"   📍 Test location: [{lat}, {lon}] → '{full_address}'")
     
     # Test progressive partial addresses
-    for i in range(1, min(5, len(parts))):  # Test first 4 syllables
-        partial = ''.join(parts[:i])
-        result = estimate_location_from_partial(partial, config_name)
-        
-        # Calculate distance from original coordinate to estimated center
-        distance_km = ((result.center_coordinate[0] - lat) ** 2 + 
-                      (result.center_coordinate[1] - lon) ** 2) ** 0.5 * 111.32
-        
+    partials = [full_address[:2 * i] for i in range(1, min(5, syllable_count))]  # Test first 4 syllables
+    results = estimate_locations_from_partials(partials, config_name)
+    
+    # Great-circle distance from original coordinate to each estimated center
+    distances_km = [
+        haversine_distance(lat, lon, *result.center_coordinate) for result in results
+    ]
+    
+    for partial, result, distance_km in zip(partials, results, distances_km):
         print(f"   ✅ '{partial}' → area {result.estimated_area_km2:.1f} km², distance from original: {distance_km:.1f} km")
         
         # The original point should be reasonably close to the estimated area
         # (This is a rough check - the original point should be within the estimated area)
+    
+    # Each additional syllable should move the estimate closer to the original point
+    for previous, current in zip(distances_km, distances_km[1:]):
+        assert current < previous, f"Estimate moved away from original: {previous:.1f} km → {current:.1f} km"
 
 def test_partial_consonant_support():
     """Test partial consonant support"""
@@ -237,6 +276,8 @@ if __name__ == "__main__":
     try:
         test_basic_functionality()
         test_completeness_levels()
+        test_repeated_prefix_estimates()
+        test_estimate_pickle_and_copy()
         test_partial_consonant_support()
         test_partial_consonant_validation()
         test_partial_consonant_area_comparison()
@@ -0,0 +1,28 @@
+"""
+JSON helpers shared by the repository scripts.
+
+Uses orjson when it is installed and falls back to the standard json module,
+producing the same 2-space indented output either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data as 2-space indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
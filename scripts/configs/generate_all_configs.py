@@ -15,18 +15,95 @@ ASSUMPTIONS:
 
 import sys
 import os
-import json
 import math
-import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Set, Any
+from typing import List, Dict, Optional, Tuple, Set, Any
 
-# Add package src directory to path
+# Digits used for base26 configuration identifiers
+_BASE26 = 'abcdefghijklmnopqrstuvwxyz'
+
+# Letter-set batches smaller than this are generated inline; process startup costs more
+_PARALLEL_MIN_BATCH = 64
+
+
+# Add package src directory and the shared script helpers to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'packages', 'python', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from _json_io import dumps_json, loads_json
 
 from h3_syllable.config_loader import SyllableConfig
 
 
+# Generated index templates; the AVAILABLE_CONFIGS JSON is written between header and footer
+PYTHON_INDEX_HEADER = b'''"""Configuration Index - Auto-generated
+
+This file is automatically generated by scripts/configs/generate_all_configs.py
+Do not edit manually.
+"""
+
+AVAILABLE_CONFIGS = '''
+
+PYTHON_INDEX_FOOTER = b'''
+
+def get_config_info(config_name: str):
+    """Get information about a configuration."""
+    for config in AVAILABLE_CONFIGS:
+        if config['name'] == config_name or config['filename'] == config_name:
+            return config
+    return None
+
+def list_configs():
+    """List all available configuration names."""
+    return [config['name'] for config in AVAILABLE_CONFIGS]
+
+def list_config_files():
+    """List all configuration filenames."""
+    return [config['filename'] for config in AVAILABLE_CONFIGS]
+'''
+
+JS_INDEX_HEADER = b'''/**
+ * Configuration Index - Auto-generated
+ * 
+ * This file is automatically generated by scripts/configs/generate_all_configs.py
+ * Do not edit manually.
+ */
+
+export const AVAILABLE_CONFIGS = '''
+
+JS_INDEX_FOOTER = b''';
+
+export function getConfigInfo(configName: string) {
+  return AVAILABLE_CONFIGS.find(config => 
+    config.name === configName || config.filename === configName
+  );
+}
+
+export function listConfigs(): string[] {
+  return AVAILABLE_CONFIGS.map(config => config.name);
+}
+
+export function listConfigFiles(): string[] {
+  return AVAILABLE_CONFIGS.map(config => config.filename);
+}
+'''
+
+
+_worker_generator = None
+
+
+def _generate_config_worker(alphabet_name: str, letters: List[str]):
+    """Process pool entry point: generate one config, returning the error instead of raising."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = ConfigGenerator()
+    try:
+        return _worker_generator.generate_config_from_letters(alphabet_name, letters)
+    except Exception as e:
+        return e
+
+
 class ConfigGenerator:
     """Generate configurations from character sets."""
     
@@ -41,67 +118,84 @@ class ConfigGenerator:
                 'name': 'ASCII',
                 'description': 'Basic Latin alphabet',
                 'characters': list('abcdefghijklmnopqrstuvwxyz'),
-                'vowels': set('aeiou'),  # Standard vowels in this alphabet
+                'vowels': frozenset('aeiou'),  # Standard vowels in this alphabet
             },
             # Future alphabets can be added here:
             # 'cyrillic': {
             #     'name': 'Cyrillic',
             #     'description': 'Cyrillic alphabet',
             #     'characters': list('абвгдежзийклмнопрстуфхцчшщъыьэюя'),
-            #     'vowels': set('аеёиоуыэюя'),
+            #     'vowels': frozenset('аеёиоуыэюя'),
             # },
         }
+        
+        # Per-alphabet lookup tables, built once
+        self._alphabet_set = {}
+        self._alphabet_index = {}
+        for name, alphabet in self.alphabets.items():
+            self._alphabet_set[name] = frozenset(alphabet['characters'])
+            self._alphabet_index[name] = {char: i for i, char in enumerate(alphabet['characters'])}
+        
+        # (alphabet, selected letters) -> (binary_array, base26_id)
+        self._id_cache = {}
     
     def calculate_min_syllables_needed(self, consonants: int, vowels: int) -> Tuple[int, int, float]:
         """
         Calculate minimum address length needed to cover H3 space.
         
         Calculate total combinations as base^length
-        where no two adjacent elements are the same.
+        (any syllable may appear at any position, including repeats).
         
         Returns:
             Tuple of (min_length, total_combinations, coverage_ratio)
         """
         total_syllables = consonants * vowels
+        max_length = 19  # Max reasonable length
         
-        # Start from length 1 and find minimum that covers H3 space
-        for length in range(1, 20):  # Max reasonable length
-            # Simple base^length calculation
-            space = total_syllables ** length
-            
-            if space >= self.h3_target:
-                coverage_ratio = space / self.h3_target
-                return length, space, coverage_ratio
+        if total_syllables < 2:
+            return None, None, None  # A single syllable can never cover H3 space
         
-        return None, None, None  # Cannot achieve with reasonable length
+        # Minimum length from logarithms, then correct for floating-point rounding
+        length = max(1, math.ceil(math.log(self.h3_target) / math.log(total_syllables)))
+        if length > 1 and total_syllables ** (length - 1) >= self.h3_target:
+            length -= 1
+        elif total_syllables ** length < self.h3_target:
+            length += 1
+        
+        if length > max_length:
+            return None, None, None  # Cannot achieve with reasonable length
+        
+        space = total_syllables ** length
+        coverage_ratio = space / self.h3_target
+        return length, space, coverage_ratio
     
     def create_binary_array(self, alphabet_name: str, selected_letters: List[str]) -> List[int]:
         """Create binary array showing which letters from alphabet are selected."""
-        alphabet = self.alphabets[alphabet_name]
-        binary_array = []
+        char_index = self._alphabet_index[alphabet_name]
+        binary_array = [0] * len(char_index)
         
-        for char in alphabet['characters']:
-            binary_array.append(1 if char in selected_letters else 0)
+        for char in selected_letters:
+            binary_array[char_index[char]] = 1
         
         return binary_array
     
     def binary_to_base26(self, binary_array: List[int]) -> str:
         """Convert binary array to base26 identifier."""
-        # Convert binary to decimal
-        decimal_value = 0
-        for i, bit in enumerate(binary_array):
-            decimal_value += bit * (2 ** i)
-        
-        # Convert decimal to base26
+        # Convert binary to decimal (bit i is worth 2^i)
+        return self.mask_to_base26(sum(bit << i for i, bit in enumerate(binary_array)))
+    
+    @staticmethod
+    def mask_to_base26(decimal_value: int) -> str:
+        """Convert a letter bitmask (bit i = alphabet character i) to base26 identifier."""
         if decimal_value == 0:
             return 'a'
         
-        result = ''
+        digits = []
         while decimal_value > 0:
-            result = chr(ord('a') + (decimal_value % 26)) + result
-            decimal_value //= 26
+            decimal_value, remainder = divmod(decimal_value, 26)
+            digits.append(_BASE26[remainder])
         
-        return result
+        return ''.join(reversed(digits))
     
     def generate_config_from_letters(self, alphabet_name: str, letters: List[str]) -> Tuple[str, Dict]:
         """
@@ -116,14 +210,17 @@ class ConfigGenerator:
         alphabet = self.alphabets[alphabet_name]
         
         # Validate all letters are in the alphabet
-        letter_set = set(letters)
-        if not letter_set.issubset(set(alphabet['characters'])):
-            invalid = letter_set - set(alphabet['characters'])
+        invalid = set(letters) - self._alphabet_set[alphabet_name]
+        if invalid:
             raise ValueError(f"Letters not in {alphabet_name} alphabet: {invalid}")
         
-        # Separate consonants and vowels
-        vowels = [l for l in letters if l in alphabet['vowels']]
-        consonants = [l for l in letters if l not in alphabet['vowels']]
+        # Sort once, then separate consonants and vowels in a single pass (both stay sorted)
+        sorted_letters = sorted(letters)
+        vowel_set = alphabet['vowels']
+        vowels = []
+        consonants = []
+        for letter in sorted_letters:
+            (vowels if letter in vowel_set else consonants).append(letter)
         
         if not vowels:
             raise ValueError("At least one vowel is required")
@@ -136,9 +233,18 @@ class ConfigGenerator:
         if min_length is None:
             raise ValueError(f"Cannot cover H3 space with {len(consonants)} consonants and {len(vowels)} vowels")
         
-        # Create binary array and base26 identifier
-        binary_array = self.create_binary_array(alphabet_name, letters)
-        base26_id = self.binary_to_base26(binary_array)
+        # Create binary array and base26 identifier (cached per letter selection)
+        id_key = (alphabet_name, frozenset(letters))
+        if id_key not in self._id_cache:
+            # Single pass over the selected letters builds the bitmask; the array is read off it
+            char_index = self._alphabet_index[alphabet_name]
+            mask = 0
+            for char in id_key[1]:
+                mask |= 1 << char_index[char]
+            binary_array = [(mask >> i) & 1 for i in range(len(char_index))]
+            self._id_cache[id_key] = (binary_array, self.mask_to_base26(mask))
+        binary_array, base26_id = self._id_cache[id_key]
+        binary_array = list(binary_array)
         
         # Create configuration name (always ascii-xxxxx format)
         config_name = f"{alphabet_name}-{base26_id}"
@@ -147,15 +253,15 @@ class ConfigGenerator:
         config = {
             'name': config_name,
             'description': f"{alphabet['description']}, {len(consonants)} consonants, {len(vowels)} vowels, {min_length} syllables",
-            'consonants': sorted(consonants),
-            'vowels': sorted(vowels),
+            'consonants': consonants,
+            'vowels': vowels,
             'address_length': min_length,
             'h3_resolution': 14,
             'metadata': {
                 'alphabet': alphabet_name,
                 'base26_identifier': base26_id,
                 'binary_array': binary_array,
-                'selected_letters': sorted(letters),
+                'selected_letters': sorted_letters,
                 'auto_generated': True,
                 'generation_method': 'international_standard',
                 'total_syllables': len(consonants) * len(vowels),
@@ -168,29 +274,78 @@ class ConfigGenerator:
         
         return config_name, config
     
+    def generate_configs(self, alphabet_name: str, letter_sets: List[List[str]],
+                         max_workers: Optional[int] = None) -> List[Any]:
+        """
+        Generate configurations for many letter selections.
+        
+        Large sweeps are spread across worker processes; small batches run inline.
+        
+        Returns:
+            List with a (config_name, config_dict) tuple per letter selection, in input order,
+            or the exception raised for that selection
+        """
+        if len(letter_sets) < _PARALLEL_MIN_BATCH:
+            results = []
+            for letters in letter_sets:
+                try:
+                    results.append(self.generate_config_from_letters(alphabet_name, letters))
+                except Exception as e:
+                    results.append(e)
+            return results
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_generate_config_worker,
+                                     [alphabet_name] * len(letter_sets), letter_sets,
+                                     chunksize=16))
+    
     def save_config(self, config_name: str, config: Dict) -> str:
         """Save configuration to JSON file."""
         self.config_dir.mkdir(exist_ok=True)
         filepath = self.config_dir / f"{config_name}.json"
         
-        with open(filepath, 'w') as f:
-            json.dump(config, f, indent=2)
+        filepath.write_bytes(dumps_json(config))
         
         return str(filepath)
+    
+    def save_configs(self, configs: List[Tuple[str, Dict]]) -> List[str]:
+        """Save several configurations, serializing all of them before writing."""
+        self.config_dir.mkdir(exist_ok=True)
+        serialized = [(self.config_dir / f"{config_name}.json", dumps_json(config))
+                      for config_name, config in configs]
+        
+        for filepath, data in serialized:
+            filepath.write_bytes(data)
+        
+        return [str(filepath) for filepath, _ in serialized]
 
 
 class ConfigExporter:
     """Exports configurations to both Python and JavaScript packages."""
     
-    def __init__(self, repo_root: str = None):
+    # Index entry keys renamed for the JavaScript package
+    JS_INFO_KEYS = {
+        'consonants_count': 'consonantsCount',
+        'vowels_count': 'vowelsCount',
+        'address_length': 'addressLength',
+        'auto_generated': 'autoGenerated',
+    }
+    
+    def __init__(self, repo_root: str = None, force: bool = False):
         if repo_root is None:
             repo_root = Path(__file__).parent.parent.parent
         
         self.repo_root = Path(repo_root)
+        self.force = force  # Re-copy files even when they look up to date
         self.shared_configs_dir = self.repo_root / "configs"
         self.python_configs_dir = self.repo_root / "packages" / "python" / "src" / "h3_syllable" / "configs"
         self.js_configs_dir = self.repo_root / "packages" / "javascript" / "src" / "configs"
         
+        # Parsed config files, shared by both index builders
+        self._parsed_cache: Dict[Path, Dict] = {}
+        # Shared config listing, taken once per export
+        self._shared_files: Optional[List[Path]] = None
+        
         # Ensure directories exist
         self.python_configs_dir.mkdir(parents=True, exist_ok=True)
         self.js_configs_dir.mkdir(parents=True, exist_ok=True)
@@ -199,172 +354,235 @@ class ConfigExporter:
         """Export all configurations to both packages."""
         print("🚀 Exporting configurations...")
         
-        # Get all JSON config files
-        config_files = list(self.shared_configs_dir.glob("*.json"))
+        # Start each export from the files on disk
+        self._shared_files = None
+        self._parsed_cache.clear()
+        
+        self._export(self._list_shared())
+    
+    def export_from_memory(self, configs: List[Tuple[str, Dict]]):
+        """Export configurations just saved to configs/, reusing the in-memory dicts."""
+        print("🚀 Exporting configurations...")
         
+        config_paths = {self.shared_configs_dir / f"{name}.json": config for name, config in configs}
+        self._shared_files = sorted(config_paths)
+        self._parsed_cache = config_paths
+        
+        self._export(self._shared_files)
+    
+    def _export(self, config_files: List[Path]):
+        """Export the given shared config files to both packages."""
         if not config_files:
             print("⚠️  No configuration files found in configs/")
             return
         
+        # Index entries are built once and shared by both packages
+        configs_info = self._build_configs_info(config_files)
+        
+        # Copy the config files into both packages, reading each source once
+        self._map_files(lambda config_file: self._mirror(config_file, self._package_config_dirs()), config_files)
+        
         # Export to Python
-        self._export_to_python(config_files)
+        self._export_to_python(config_files, configs_info)
         
         # Export to JavaScript
-        self._export_to_javascript(config_files)
+        self._export_to_javascript(config_files, configs_info)
         
         print(f"✅ Successfully exported {len(config_files)} configurations")
     
-    def _export_to_python(self, config_files: List[Path]):
+    @staticmethod
+    def _list_json_files(directory: Path) -> List[Path]:
+        """List JSON files in a directory with a single scandir pass."""
+        if not directory.is_dir():
+            return []
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+    
+    @staticmethod
+    def _count_json_files(directory: Path) -> int:
+        """Count JSON files in a directory without building a listing."""
+        if not directory.is_dir():
+            return 0
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(".json") and entry.is_file())
+    
+    def _list_shared(self) -> List[Path]:
+        """List shared config files, reusing the listing taken by the current export."""
+        if self._shared_files is None:
+            self._shared_files = self._list_json_files(self.shared_configs_dir)
+        return self._shared_files
+    
+    def _load_config(self, config_file: Path) -> Dict:
+        """Load a configuration file, parsing each file only once."""
+        if config_file not in self._parsed_cache:
+            self._parsed_cache[config_file] = loads_json(config_file.read_bytes())
+        return self._parsed_cache[config_file]
+    
+    @staticmethod
+    def _map_files(func, config_files: List[Path]) -> List[Any]:
+        """Apply an I/O-bound function to each file on a thread pool, keeping input order."""
+        max_workers = min(32, (os.cpu_count() or 1) * 4, max(1, len(config_files)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, config_files))
+    
+    def _load_configs(self, config_files: List[Path]) -> List[Tuple[Path, Dict]]:
+        """Load all configuration files, reporting unreadable ones once at the end."""
+        def load(config_file: Path):
+            try:
+                return config_file, self._load_config(config_file), None
+            except (OSError, ValueError) as e:
+                return config_file, None, e
+        
+        loaded = []
+        failures = []
+        
+        for config_file, config_data, error in self._map_files(load, config_files):
+            if error is None:
+                loaded.append((config_file, config_data))
+            else:
+                failures.append((config_file, error))
+        
+        for config_file, error in failures:
+            print(f"⚠️  Warning: Could not process {config_file.name}: {error}")
+        
+        return loaded
+    
+    def _package_config_dirs(self) -> Tuple[Path, Path]:
+        """Config directories of the Python and JavaScript packages."""
+        return self.python_configs_dir, self.js_configs_dir
+    
+    @staticmethod
+    def _is_up_to_date(src_stat: os.stat_result, dest_file: Path) -> bool:
+        """Check whether dest_file is already a separate copy of the source (same size and mtime)."""
+        try:
+            dest_stat = dest_file.stat()
+        except FileNotFoundError:
+            return False
+        
+        # Hardlinks left by older exports share the source inode; replace them
+        if os.path.samestat(src_stat, dest_stat):
+            return False
+        
+        # Copies carry the source's nanosecond mtime, so any later rewrite of either side shows up
+        return (src_stat.st_size == dest_stat.st_size
+                and src_stat.st_mtime_ns == dest_stat.st_mtime_ns)
+    
+    def _mirror(self, config_file: Path, dest_dirs: Tuple[Path, ...]):
+        """Copy a config file into each dest_dir, reading it once and skipping up-to-date copies."""
+        src_stat = config_file.stat()
+        dest_files = [dest_dir / config_file.name for dest_dir in dest_dirs]
+        if not self.force:
+            dest_files = [dest_file for dest_file in dest_files
+                          if not self._is_up_to_date(src_stat, dest_file)]
+        if not dest_files:
+            return
+        
+        data = config_file.read_bytes()
+        for dest_file in dest_files:
+            # Write a temporary file and swap it in, so the package copy never
+            # shares an inode (and in-place writes) with the source config
+            temp_file = dest_file.with_name(f".{dest_file.name}.tmp")
+            temp_file.write_bytes(data)
+            os.utime(temp_file, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            os.replace(temp_file, dest_file)
+    
+    def _export_to_python(self, config_files: List[Path], configs_info: List[Dict]):
         """Export configurations to Python package."""
         print("📦 Exporting to Python package...")
         
-        # Copy all JSON files directly
-        for config_file in config_files:
-            dest_file = self.python_configs_dir / config_file.name
-            shutil.copy2(config_file, dest_file)
-        
         # Create Python config index
-        self._create_python_config_index(config_files)
+        self._create_python_config_index(configs_info)
         
         print(f"  ✅ Python: {len(config_files)} configs exported")
     
-    def _export_to_javascript(self, config_files: List[Path]):
+    def _export_to_javascript(self, config_files: List[Path], configs_info: List[Dict]):
         """Export configurations to JavaScript package."""
         print("📦 Exporting to JavaScript package...")
         
-        # Copy all JSON files directly
-        for config_file in config_files:
-            dest_file = self.js_configs_dir / config_file.name
-            shutil.copy2(config_file, dest_file)
-        
         # Create JavaScript config index
-        self._create_javascript_config_index(config_files)
+        self._create_javascript_config_index(configs_info)
         
         print(f"  ✅ JavaScript: {len(config_files)} configs exported")
     
-    def _create_python_config_index(self, config_files: List[Path]):
-        """Create Python configuration index file."""
+    def _build_configs_info(self, config_files: List[Path]) -> List[Dict]:
+        """Build index entries (Python-style keys) for all loadable config files."""
         configs_info = []
         
-        for config_file in config_files:
-            try:
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
-                
-                config_info = {
-                    'filename': config_file.name,
-                    'name': config_data.get('name', config_file.stem),
-                    'description': config_data.get('description', ''),
-                    'consonants_count': len(config_data.get('consonants', [])),
-                    'vowels_count': len(config_data.get('vowels', [])),
-                    'address_length': config_data.get('address_length', 8),
-                    'identifier': config_data.get('metadata', {}).get('identifier', ''),
-                    'auto_generated': config_data.get('metadata', {}).get('auto_generated', False)
-                }
-                
-                configs_info.append(config_info)
-                
-            except Exception as e:
-                print(f"⚠️  Warning: Could not process {config_file.name}: {e}")
-        
-        # Write Python config index
-        index_content = f'''"""Configuration Index - Auto-generated
-
-This file is automatically generated by scripts/configs/generate_all_configs.py
-Do not edit manually.
-"""
-
-AVAILABLE_CONFIGS = {json.dumps(configs_info, indent=2)}
-
-def get_config_info(config_name: str):
-    """Get information about a configuration."""
-    for config in AVAILABLE_CONFIGS:
-        if config['name'] == config_name or config['filename'] == config_name:
-            return config
-    return None
-
-def list_configs():
-    """List all available configuration names."""
-    return [config['name'] for config in AVAILABLE_CONFIGS]
-
-def list_config_files():
-    """List all configuration filenames."""
-    return [config['filename'] for config in AVAILABLE_CONFIGS]
-'''
+        for config_file, config_data in self._load_configs(config_files):
+            config_info = {
+                'filename': config_file.name,
+                'name': config_data.get('name', config_file.stem),
+                'description': config_data.get('description', ''),
+                'consonants_count': len(config_data.get('consonants', [])),
+                'vowels_count': len(config_data.get('vowels', [])),
+                'address_length': config_data.get('address_length', 8),
+                'identifier': config_data.get('metadata', {}).get('identifier', ''),
+                'auto_generated': config_data.get('metadata', {}).get('auto_generated', False)
+            }
+            
+            configs_info.append(config_info)
         
-        with open(self.python_configs_dir / "config_index.py", 'w') as f:
-            f.write(index_content)
+        return configs_info
     
-    def _create_javascript_config_index(self, config_files: List[Path]):
+    def _create_python_config_index(self, configs_info: List[Dict]):
+        """Create Python configuration index file."""
+        self._write_index(self.python_configs_dir / "config_index.py",
+                          PYTHON_INDEX_HEADER, dumps_json(configs_info), PYTHON_INDEX_FOOTER)
+    
+    def _create_javascript_config_index(self, configs_info: List[Dict]):
         """Create JavaScript configuration index file."""
-        configs_info = []
-        
-        for config_file in config_files:
-            try:
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
-                
-                config_info = {
-                    'filename': config_file.name,
-                    'name': config_data.get('name', config_file.stem),
-                    'description': config_data.get('description', ''),
-                    'consonantsCount': len(config_data.get('consonants', [])),
-                    'vowelsCount': len(config_data.get('vowels', [])),
-                    'addressLength': config_data.get('address_length', 8),
-                    'identifier': config_data.get('metadata', {}).get('identifier', ''),
-                    'autoGenerated': config_data.get('metadata', {}).get('auto_generated', False)
-                }
-                
-                configs_info.append(config_info)
-                
-            except Exception as e:
-                print(f"⚠️  Warning: Could not process {config_file.name}: {e}")
-        
-        # Write JavaScript config index
-        index_content = f'''/**
- * Configuration Index - Auto-generated
- * 
- * This file is automatically generated by scripts/configs/generate_all_configs.py
- * Do not edit manually.
- */
-
-export const AVAILABLE_CONFIGS = {json.dumps(configs_info, indent=2)};
-
-export function getConfigInfo(configName: string) {{
-  return AVAILABLE_CONFIGS.find(config => 
-    config.name === configName || config.filename === configName
-  );
-}}
-
-export function listConfigs(): string[] {{
-  return AVAILABLE_CONFIGS.map(config => config.name);
-}}
-
-export function listConfigFiles(): string[] {{
-  return AVAILABLE_CONFIGS.map(config => config.filename);
-}}
-'''
-        
-        with open(self.js_configs_dir / "config-index.ts", 'w') as f:
-            f.write(index_content)
+        # Same entries as the Python index, with camelCase keys
+        configs_info = [
+            {self.JS_INFO_KEYS.get(key, key): value for key, value in config_info.items()}
+            for config_info in configs_info
+        ]
+        
+        self._write_index(self.js_configs_dir / "config-index.ts",
+                          JS_INDEX_HEADER, dumps_json(configs_info), JS_INDEX_FOOTER)
+    
+    @staticmethod
+    def _write_index(index_path: Path, header: bytes, configs_json: bytes, footer: bytes):
+        """Write an index file piecewise, without assembling the whole content first."""
+        # Leave an unchanged index untouched so its mtime doesn't trigger rebuilds
+        try:
+            existing = index_path.read_bytes()
+        except FileNotFoundError:
+            existing = None
+        
+        if existing is not None:
+            header_end = len(header)
+            json_end = header_end + len(configs_json)
+            if (len(existing) == json_end + len(footer)
+                    and existing.startswith(header)
+                    and existing.endswith(footer)
+                    and memoryview(existing)[header_end:json_end] == configs_json):
+                return
+        
+        with open(index_path, 'wb') as f:
+            f.write(header)
+            f.write(configs_json)
+            f.write(footer)
     
     def validate_export(self) -> bool:
         """Validate that the export was successful."""
-        python_files = list(self.python_configs_dir.glob("*.json"))
-        js_files = list(self.js_configs_dir.glob("*.json"))
-        shared_files = list(self.shared_configs_dir.glob("*.json"))
+        python_count = self._count_json_files(self.python_configs_dir)
+        js_count = self._count_json_files(self.js_configs_dir)
+        shared_count = len(self._list_shared())
         
         print(f"📊 Validation details:")
-        print(f"  Shared configs: {len(shared_files)}")
-        print(f"  Python configs: {len(python_files)}")
-        print(f"  JavaScript configs: {len(js_files)}")
+        print(f"  Shared configs: {shared_count}")
+        print(f"  Python configs: {python_count}")
+        print(f"  JavaScript configs: {js_count}")
         
-        if len(python_files) != len(shared_files):
-            print(f"❌ Python export incomplete: {len(python_files)} != {len(shared_files)}")
+        if python_count != shared_count:
+            print(f"❌ Python export incomplete: {python_count} != {shared_count}")
             return False
         
-        if len(js_files) != len(shared_files):
-            print(f"❌ JavaScript export incomplete: {len(js_files)} != {len(shared_files)}")
+        if js_count != shared_count:
+            print(f"❌ JavaScript export incomplete: {js_count} != {shared_count}")
             return False
         
         # Check index files exist
@@ -403,44 +621,52 @@ def main():
     print("🧹 Cleaning old configuration files...")
     config_dir = generator.config_dir
     if config_dir.exists():
+        # Only JSON configs are removed; anything else in the directory is kept
         removed = 0
-        for config_file in config_dir.glob("*.json"):
-            config_file.unlink()
-            removed += 1
+        with os.scandir(config_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    os.unlink(entry.path)
+                    removed += 1
         print(f"   Removed {removed} old files")
     print()
     
     # Generate configurations
     print("📝 Generating configurations...")
     all_configs = []
+    log_lines: List[str] = []  # Per-config summaries, written out together
     
-    for letter_set in letter_sets:
-        try:
-            letters = letter_set['letters']
-            desc = letter_set['description']
-            
-            config_name, config = generator.generate_config_from_letters('ascii', letters)
-            all_configs.append((config_name, config))
-            
-            print(f"✅ {config_name}")
-            print(f"   {desc}")
-            print(f"   {len(config['consonants'])}C × {len(config['vowels'])}V = "
-                  f"{len(config['consonants']) * len(config['vowels'])} syllables, "
-                  f"{config['address_length']} length")
-            print(f"   Combinations: {config['metadata']['total_combinations']:,}")
-            print(f"   Coverage: {config['metadata']['coverage_multiple']} H3 space")
-            
-        except ValueError as e:
-            print(f"❌ Failed for {desc}: {e}")
-        except Exception as e:
-            print(f"❌ Unexpected error for {desc}: {e}")
+    results = generator.generate_configs('ascii', [letter_set['letters'] for letter_set in letter_sets])
+    
+    for letter_set, result in zip(letter_sets, results):
+        desc = letter_set['description']
+        
+        if isinstance(result, ValueError):
+            log_lines.append(f"❌ Failed for {desc}: {result}")
+            continue
+        if isinstance(result, Exception):
+            log_lines.append(f"❌ Unexpected error for {desc}: {result}")
+            continue
+        
+        config_name, config = result
+        all_configs.append((config_name, config))
+        
+        log_lines.extend([
+            f"✅ {config_name}",
+            f"   {desc}",
+            f"   {len(config['consonants'])}C × {len(config['vowels'])}V = "
+            f"{len(config['consonants']) * len(config['vowels'])} syllables, "
+            f"{config['address_length']} length",
+            f"   Combinations: {config['metadata']['total_combinations']:,}",
+            f"   Coverage: {config['metadata']['coverage_multiple']} H3 space",
+        ])
+    
+    if log_lines:
+        sys.stdout.write('\n'.join(log_lines) + '\n')
     
     # Save all configurations
     print(f"\n💾 Saving {len(all_configs)} configurations...")
-    saved = 0
-    for config_name, config in all_configs:
-        filepath = generator.save_config(config_name, config)
-        saved += 1
+    saved = len(generator.save_configs(all_configs))
     
     print(f"✅ Saved {saved} configurations to {config_dir}")
     
@@ -448,7 +674,7 @@ def main():
     print(f"\n📦 Exporting to Python and JavaScript packages...")
     try:
         exporter = ConfigExporter()
-        exporter.export_all_configs()
+        exporter.export_from_memory(all_configs)
         
         if exporter.validate_export():
             print("✅ Export completed successfully!")
@@ -0,0 +1,386 @@
+"""
+H3 level 0 adjacency constants - Auto-generated
+
+This file is automatically generated by scripts/hamiltonian/generate_adjacency_constants.py
+Do not edit manually.
+
+All tuples are indexed by base cell number (0-121):
+- ADJACENCY: neighbors of each cell, in base cell order
+- ADJACENCY_MASKS: bit n set when base cell n is a neighbor
+- NEIGHBORS_BY_DEGREE: neighbors sorted by degree, most constrained first
+"""
+
+ADJACENCY = (
+    (1, 2, 3, 4, 5, 8),
+    (0, 2, 3, 6, 7, 9),
+    (0, 1, 5, 6, 10, 11),
+    (0, 1, 4, 7, 12, 13),
+    (0, 3, 8, 12, 15),
+    (0, 2, 8, 10, 16, 18),
+    (1, 2, 9, 11, 14, 17),
+    (1, 3, 9, 13, 19, 21),
+    (0, 4, 5, 15, 16, 22),
+    (1, 6, 7, 14, 19, 20),
+    (2, 5, 11, 18, 23, 24),
+    (2, 6, 10, 17, 23, 25),
+    (3, 4, 13, 15, 26, 28),
+    (3, 7, 12, 21, 26, 29),
+    (6, 9, 17, 20, 27),
+    (4, 8, 12, 22, 28, 31),
+    (5, 8, 18, 22, 30, 33),
+    (6, 11, 14, 25, 27, 35),
+    (5, 10, 16, 24, 30, 32),
+    (7, 9, 20, 21, 34, 36),
+    (9, 14, 19, 27, 36, 40),
+    (7, 13, 19, 29, 34, 38),
+    (8, 15, 16, 31, 33, 41),
+    (10, 11, 24, 25, 37, 39),
+    (10, 18, 23, 32, 37),
+    (11, 17, 23, 35, 39, 45),
+    (12, 13, 28, 29, 42, 43),
+    (14, 17, 20, 35, 40, 46),
+    (12, 15, 26, 31, 42, 44),
+    (13, 21, 26, 38, 43, 47),
+    (16, 18, 32, 33, 48, 50),
+    (15, 22, 28, 41, 44, 53),
+    (18, 24, 30, 37, 50, 52),
+    (16, 22, 30, 41, 48, 49),
+    (19, 21, 36, 38, 51, 54),
+    (17, 25, 27, 45, 46, 56),
+    (19, 20, 34, 40, 54, 55),
+    (23, 24, 32, 39, 52, 57),
+    (21, 29, 34, 47, 51),
+    (23, 25, 37, 45, 57, 59),
+    (20, 27, 36, 46, 55, 60),
+    (22, 31, 33, 49, 53, 61),
+    (26, 28, 43, 44, 58, 62),
+    (26, 29, 42, 47, 62, 64),
+    (28, 31, 42, 53, 58, 65),
+    (25, 35, 39, 56, 59, 63),
+    (27, 35, 40, 56, 60, 68),
+    (29, 38, 43, 51, 64, 69),
+    (30, 33, 49, 50, 66, 67),
+    (33, 41, 48, 61, 66),
+    (30, 32, 48, 52, 67, 70),
+    (34, 38, 47, 54, 69, 71),
+    (32, 37, 50, 57, 70, 74),
+    (31, 41, 44, 61, 65, 75),
+    (34, 36, 51, 55, 71, 73),
+    (36, 40, 54, 60, 72, 73),
+    (35, 45, 46, 63, 68, 77),
+    (37, 39, 52, 59, 74, 78),
+    (42, 44, 62, 65, 76),
+    (39, 45, 57, 63, 78, 79),
+    (40, 46, 55, 68, 72, 80),
+    (41, 49, 53, 66, 75, 81),
+    (42, 43, 58, 64, 76, 82),
+    (45, 56, 59, 77, 79),
+    (43, 47, 62, 69, 82, 84),
+    (44, 53, 58, 75, 76, 86),
+    (48, 49, 61, 67, 81, 85),
+    (48, 50, 66, 70, 85, 87),
+    (46, 56, 60, 77, 80, 90),
+    (47, 51, 64, 71, 84, 89),
+    (50, 52, 67, 74, 83, 87),
+    (51, 54, 69, 73, 89, 91),
+    (55, 60, 73, 80, 88),
+    (54, 55, 71, 72, 88, 91),
+    (52, 57, 70, 78, 83, 92),
+    (53, 61, 65, 81, 86, 94),
+    (58, 62, 65, 82, 86, 96),
+    (56, 63, 68, 79, 90, 93),
+    (57, 59, 74, 79, 92, 95),
+    (59, 63, 77, 78, 93, 95),
+    (60, 68, 72, 88, 90, 99),
+    (61, 66, 75, 85, 94, 101),
+    (62, 64, 76, 84, 96, 98),
+    (70, 74, 87, 92, 100),
+    (64, 69, 82, 89, 97, 98),
+    (66, 67, 81, 87, 101, 102),
+    (65, 75, 76, 94, 96, 104),
+    (67, 70, 83, 85, 100, 102),
+    (72, 73, 80, 91, 99, 105),
+    (69, 71, 84, 91, 97, 103),
+    (68, 77, 80, 93, 99, 106),
+    (71, 73, 88, 89, 103, 105),
+    (74, 78, 83, 95, 100, 108),
+    (77, 79, 90, 95, 106, 109),
+    (75, 81, 86, 101, 104, 107),
+    (78, 79, 92, 93, 108, 109),
+    (76, 82, 86, 98, 104, 110),
+    (84, 89, 98, 103, 111),
+    (82, 84, 96, 97, 110, 111),
+    (80, 88, 90, 105, 106, 113),
+    (83, 87, 92, 102, 108, 114),
+    (81, 85, 94, 102, 107, 112),
+    (85, 87, 100, 101, 112, 114),
+    (89, 91, 97, 105, 111, 116),
+    (86, 94, 96, 107, 110, 115),
+    (88, 91, 99, 103, 113, 116),
+    (90, 93, 99, 109, 113, 117),
+    (94, 101, 104, 112, 115),
+    (92, 95, 100, 109, 114, 118),
+    (93, 95, 106, 108, 117, 118),
+    (96, 98, 104, 111, 115, 119),
+    (97, 98, 103, 110, 116, 119),
+    (101, 102, 107, 114, 115, 120),
+    (99, 105, 106, 116, 117, 121),
+    (100, 102, 108, 112, 118, 120),
+    (104, 107, 110, 112, 119, 120),
+    (103, 105, 111, 113, 119, 121),
+    (106, 109, 113, 118, 121),
+    (108, 109, 114, 117, 120, 121),
+    (110, 111, 115, 116, 120, 121),
+    (112, 114, 115, 118, 119, 121),
+    (113, 116, 117, 118, 119, 120),
+)
+
+ADJACENCY_MASKS = (
+    0x13e,
+    0x2cd,
+    0xc63,
+    0x3093,
+    0x9109,
+    0x50505,
+    0x24a06,
+    0x28220a,
+    0x418031,
+    0x1840c2,
+    0x1840824,
+    0x2820444,
+    0x1400a018,
+    0x24201088,
+    0x8120240,
+    0x90401110,
+    0x240440120,
+    0x80a004840,
+    0x141010420,
+    0x1400300280,
+    0x11008084200,
+    0x4420082080,
+    0x20280018100,
+    0xa003000c00,
+    0x2100840400,
+    0x208800820800,
+    0xc0030003000,
+    0x410800124000,
+    0x140084009000,
+    0x884004202000,
+    0x5000300050000,
+    0x20120010408000,
+    0x14002041040000,
+    0x3020040410000,
+    0x48005000280000,
+    0x10060000a020000,
+    0xc0010400180000,
+    0x210008101800000,
+    0x8800420200000,
+    0xa00202002800000,
+    0x1080401008100000,
+    0x2022000280400000,
+    0x4400180014000000,
+    0x14000840024000000,
+    0x20420040090000000,
+    0x8900008802000000,
+    0x101100010808000000,
+    0x210008084020000000,
+    0xc0006000240000000,
+    0x42001020200000000,
+    0x480011000140000000,
+    0xa00040804400000000,
+    0x4400204002100000000,
+    0x8022000120080000000,
+    0x2800088001400000000,
+    0x3001040011000000000,
+    0x20108000600800000000,
+    0x4400081000a000000000,
+    0x10024000140000000000,
+    0xc0008200208000000000,
+    0x101100080410000000000,
+    0x208040022020000000000,
+    0x4100104000c0000000000,
+    0xa0000900200000000000,
+    0x1400204000880000000000,
+    0x4018000420100000000000,
+    0x2200082003000000000000,
+    0xa000440005000000000000,
+    0x40120001100400000000000,
+    0x21000810008800000000000,
+    0x8804080014000000000000,
+    0xa0002200048000000000000,
+    0x10102001080000000000000,
+    0x900018000c0000000000000,
+    0x100840400210000000000000,
+    0x404200022020000000000000,
+    0x1004400024400000000000000,
+    0x240080108100000000000000,
+    0x900084000a00000000000000,
+    0xa00060008800000000000000,
+    0x8050001101000000000000000,
+    0x20402008042000000000000000,
+    0x5001010014000000000000000,
+    0x10108004400000000000000000,
+    0x6020400210000000000000000,
+    0x600082000c0000000000000000,
+    0x101400018020000000000000000,
+    0x50002800480000000000000000,
+    0x208080103000000000000000000,
+    0x82081000a00000000000000000,
+    0x408200120100000000000000000,
+    0x280030002800000000000000000,
+    0x1010800844000000000000000000,
+    0x24008400a0000000000000000000,
+    0x920004208000000000000000000,
+    0x30003000c0000000000000000000,
+    0x4104004410000000000000000000,
+    0x8084021000000000000000000000,
+    0xc003001400000000000000000000,
+    0x20600050100000000000000000000,
+    0x41040108800000000000000000000,
+    0x10840402200000000000000000000,
+    0x5003000a000000000000000000000,
+    0x1082020a0000000000000000000000,
+    0x84801404000000000000000000000,
+    0x120088090000000000000000000000,
+    0x222008240000000000000000000000,
+    0x90120400000000000000000000000,
+    0x442010900000000000000000000000,
+    0x601400a00000000000000000000000,
+    0x888105000000000000000000000000,
+    0x904086000000000000000000000000,
+    0x10c0860000000000000000000000000,
+    0x2300608000000000000000000000000,
+    0x1411050000000000000000000000000,
+    0x1814900000000000000000000000000,
+    0x2828280000000000000000000000000,
+    0x2422400000000000000000000000000,
+    0x3243000000000000000000000000000,
+    0x318c000000000000000000000000000,
+    0x2cd0000000000000000000000000000,
+    0x1f20000000000000000000000000000,
+)
+
+NEIGHBORS_BY_DEGREE = (
+    (4, 1, 2, 3, 5, 8),
+    (0, 2, 3, 6, 7, 9),
+    (0, 1, 5, 6, 10, 11),
+    (4, 0, 1, 7, 12, 13),
+    (0, 3, 8, 12, 15),
+    (0, 2, 8, 10, 16, 18),
+    (14, 1, 2, 9, 11, 17),
+    (1, 3, 9, 13, 19, 21),
+    (4, 0, 5, 15, 16, 22),
+    (14, 1, 6, 7, 19, 20),
+    (24, 2, 5, 11, 18, 23),
+    (2, 6, 10, 17, 23, 25),
+    (4, 3, 13, 15, 26, 28),
+    (3, 7, 12, 21, 26, 29),
+    (6, 9, 17, 20, 27),
+    (4, 8, 12, 22, 28, 31),
+    (5, 8, 18, 22, 30, 33),
+    (14, 6, 11, 25, 27, 35),
+    (24, 5, 10, 16, 30, 32),
+    (7, 9, 20, 21, 34, 36),
+    (14, 9, 19, 27, 36, 40),
+    (38, 7, 13, 19, 29, 34),
+    (8, 15, 16, 31, 33, 41),
+    (24, 10, 11, 25, 37, 39),
+    (10, 18, 23, 32, 37),
+    (11, 17, 23, 35, 39, 45),
+    (12, 13, 28, 29, 42, 43),
+    (14, 17, 20, 35, 40, 46),
+    (12, 15, 26, 31, 42, 44),
+    (38, 13, 21, 26, 43, 47),
+    (16, 18, 32, 33, 48, 50),
+    (15, 22, 28, 41, 44, 53),
+    (24, 18, 30, 37, 50, 52),
+    (49, 16, 22, 30, 41, 48),
+    (38, 19, 21, 36, 51, 54),
+    (17, 25, 27, 45, 46, 56),
+    (19, 20, 34, 40, 54, 55),
+    (24, 23, 32, 39, 52, 57),
+    (21, 29, 34, 47, 51),
+    (23, 25, 37, 45, 57, 59),
+    (20, 27, 36, 46, 55, 60),
+    (49, 22, 31, 33, 53, 61),
+    (58, 26, 28, 43, 44, 62),
+    (26, 29, 42, 47, 62, 64),
+    (58, 28, 31, 42, 53, 65),
+    (63, 25, 35, 39, 56, 59),
+    (27, 35, 40, 56, 60, 68),
+    (38, 29, 43, 51, 64, 69),
+    (49, 30, 33, 50, 66, 67),
+    (33, 41, 48, 61, 66),
+    (30, 32, 48, 52, 67, 70),
+    (38, 34, 47, 54, 69, 71),
+    (32, 37, 50, 57, 70, 74),
+    (31, 41, 44, 61, 65, 75),
+    (34, 36, 51, 55, 71, 73),
+    (72, 36, 40, 54, 60, 73),
+    (63, 35, 45, 46, 68, 77),
+    (37, 39, 52, 59, 74, 78),
+    (42, 44, 62, 65, 76),
+    (63, 39, 45, 57, 78, 79),
+    (72, 40, 46, 55, 68, 80),
+    (49, 41, 53, 66, 75, 81),
+    (58, 42, 43, 64, 76, 82),
+    (45, 56, 59, 77, 79),
+    (43, 47, 62, 69, 82, 84),
+    (58, 44, 53, 75, 76, 86),
+    (49, 48, 61, 67, 81, 85),
+    (48, 50, 66, 70, 85, 87),
+    (46, 56, 60, 77, 80, 90),
+    (47, 51, 64, 71, 84, 89),
+    (83, 50, 52, 67, 74, 87),
+    (51, 54, 69, 73, 89, 91),
+    (55, 60, 73, 80, 88),
+    (72, 54, 55, 71, 88, 91),
+    (83, 52, 57, 70, 78, 92),
+    (53, 61, 65, 81, 86, 94),
+    (58, 62, 65, 82, 86, 96),
+    (63, 56, 68, 79, 90, 93),
+    (57, 59, 74, 79, 92, 95),
+    (63, 59, 77, 78, 93, 95),
+    (72, 60, 68, 88, 90, 99),
+    (61, 66, 75, 85, 94, 101),
+    (62, 64, 76, 84, 96, 98),
+    (70, 74, 87, 92, 100),
+    (97, 64, 69, 82, 89, 98),
+    (66, 67, 81, 87, 101, 102),
+    (65, 75, 76, 94, 96, 104),
+    (83, 67, 70, 85, 100, 102),
+    (72, 73, 80, 91, 99, 105),
+    (97, 69, 71, 84, 91, 103),
+    (68, 77, 80, 93, 99, 106),
+    (71, 73, 88, 89, 103, 105),
+    (83, 74, 78, 95, 100, 108),
+    (77, 79, 90, 95, 106, 109),
+    (107, 75, 81, 86, 101, 104),
+    (78, 79, 92, 93, 108, 109),
+    (76, 82, 86, 98, 104, 110),
+    (84, 89, 98, 103, 111),
+    (97, 82, 84, 96, 110, 111),
+    (80, 88, 90, 105, 106, 113),
+    (83, 87, 92, 102, 108, 114),
+    (107, 81, 85, 94, 102, 112),
+    (85, 87, 100, 101, 112, 114),
+    (97, 89, 91, 105, 111, 116),
+    (107, 86, 94, 96, 110, 115),
+    (88, 91, 99, 103, 113, 116),
+    (117, 90, 93, 99, 109, 113),
+    (94, 101, 104, 112, 115),
+    (92, 95, 100, 109, 114, 118),
+    (117, 93, 95, 106, 108, 118),
+    (96, 98, 104, 111, 115, 119),
+    (97, 98, 103, 110, 116, 119),
+    (107, 101, 102, 114, 115, 120),
+    (117, 99, 105, 106, 116, 121),
+    (100, 102, 108, 112, 118, 120),
+    (107, 104, 110, 112, 119, 120),
+    (103, 105, 111, 113, 119, 121),
+    (106, 109, 113, 118, 121),
+    (117, 108, 109, 114, 120, 121),
+    (110, 111, 115, 116, 120, 121),
+    (112, 114, 115, 118, 119, 121),
+    (117, 113, 116, 118, 119, 120),
+)
@@ -0,0 +1,28 @@
+"""
+Shared H3 level 0 helpers for the Hamiltonian path tools.
+
+The ordering generator, comparison and visualization scripts all work on the
+same 122 level 0 cells; building them here keeps one cached copy per process.
+Orderings are stored as cell order only; position_map derives the inverse.
+"""
+
+import sys
+import os
+import functools
+from typing import Dict, List
+
+# Add the package source to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python', 'src'))
+from h3_syllable.h3_level0_reorganizer import H3Level0Reorganizer
+
+
+@functools.lru_cache(maxsize=1)
+def get_level0_cells():
+    """Build the reorganizer and its level 0 cells once per process (cells are never mutated)."""
+    reorganizer = H3Level0Reorganizer()
+    return reorganizer, reorganizer.get_all_level0_cells()
+
+
+def position_map(cell_order: List[int]) -> Dict[int, int]:
+    """Map each original base cell number to its position in a cell ordering."""
+    return {original_cell: new_position for new_position, original_cell in enumerate(cell_order)}
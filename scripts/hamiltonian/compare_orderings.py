@@ -8,37 +8,41 @@ vs the new Hamiltonian path ordering.
 
 import sys
 import os
-import json
+import h3
+import matplotlib
+matplotlib.use("Agg")  # Files only - no GUI backend needed
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Add the package source to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python', 'src'))
-
-# Import h3_level0_reorganizer directly
-import importlib.util
-reorganizer_path = os.path.join(os.path.dirname(__file__), '..', 'python', 'src', 'h3_syllable', 'h3_level0_reorganizer.py')
-spec = importlib.util.spec_from_file_location("h3_level0_reorganizer", reorganizer_path)
-reorganizer_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(reorganizer_module)
-H3Level0Reorganizer = reorganizer_module.H3Level0Reorganizer
+# Add the shared script helpers to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from _json_io import dumps_json, loads_json
+from _level0 import get_level0_cells, position_map
 
 
 class OrderingComparator:
     """Compares different H3 level 0 orderings."""
     
     def __init__(self):
-        self.reorganizer = H3Level0Reorganizer()
-        self.cells = self.reorganizer.get_all_level0_cells()
-        self.cell_lookup = {cell.base_cell_number: cell for cell in self.cells}
+        self.reorganizer, self.cells = get_level0_cells()
+        
+        # Base cell numbers are the contiguous range 0-121, so index a list directly
+        self.cells_by_num = [None] * len(self.cells)
+        for cell in self.cells:
+            self.cells_by_num[cell.base_cell_number] = cell
+        
+        # Neighbor sets are fixed for level 0 cells, so look them up only once
+        self._neighbors = {cell.cell_id: frozenset(h3.grid_ring(cell.cell_id, 1)) for cell in self.cells}
+        self._adjacency_cache = {}
         
     def load_hamiltonian_config(self, config_path: str) -> dict:
         """Load the Hamiltonian path configuration."""
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        return config
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        return loads_json(data)
     
-    def create_comparison_visualization(self, hamiltonian_path: list, output_dir: str):
+    def create_comparison_visualization(self, hamiltonian_path: list, output_dir: str,
+                                        formats: tuple = ("png",), dpi: int = 150):
         """Create side-by-side comparison of original vs Hamiltonian ordering."""
         
         print("🔍 Creating Ordering Comparison Visualization")
@@ -48,32 +52,29 @@ class OrderingComparator:
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(24, 20))
         
         # Original ordering (0-121)
-        original_order = list(range(122))
+        original_order = tuple(range(122))
+        
+        # Original cell number -> Hamiltonian position
+        positions = position_map(hamiltonian_path)
         
         # === TOP LEFT: Original H3 Ordering ===
         ax1.set_title('Original H3 Level 0 Ordering\\nBase Cell Numbers 0-121 (25.6% Adjacency)', 
                       fontsize=14, fontweight='bold', pad=20)
         
-        # Plot original ordering
-        for i, base_num in enumerate(original_order):
-            cell = self.cell_lookup[base_num]
-            
-            # Color by cell type
-            if cell.cell_type == 'hexagon':
-                ax1.scatter(cell.longitude, cell.latitude, c='lightblue', s=60, 
-                           marker='h', edgecolor='navy', linewidth=1, alpha=0.8)
-                text_color = 'navy'
-            else:  # pentagon
-                ax1.scatter(cell.longitude, cell.latitude, c='lightcoral', s=70, 
-                           marker='p', edgecolor='darkred', linewidth=1, alpha=0.9)
-                text_color = 'darkred'
-            
-            # Add cell number
-            ax1.annotate(str(base_num), (cell.longitude, cell.latitude), 
+        # Plot original ordering - one scatter per cell type, labels on top
+        lngs, lats, hex_mask = self._cell_arrays(original_order)
+        ax1.scatter(lngs[hex_mask], lats[hex_mask], c='lightblue', s=60, 
+                   marker='h', edgecolor='navy', linewidth=1, alpha=0.8)
+        ax1.scatter(lngs[~hex_mask], lats[~hex_mask], c='lightcoral', s=70, 
+                   marker='p', edgecolor='darkred', linewidth=1, alpha=0.9)
+        
+        # Add cell numbers
+        for base_num, lng, lat, is_hex in zip(original_order, lngs, lats, hex_mask):
+            ax1.annotate(str(base_num), (lng, lat), 
                         xytext=(0, 0), textcoords='offset points',
                         fontsize=6, fontweight='bold', color='white', 
                         ha='center', va='center',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor=text_color, alpha=0.8))
+                        bbox=dict(boxstyle='round,pad=0.2', facecolor='navy' if is_hex else 'darkred', alpha=0.8))
         
         ax1.set_xlim(-185, 185)
         ax1.set_ylim(-85, 85)
@@ -86,36 +87,28 @@ class OrderingComparator:
                       fontsize=14, fontweight='bold', pad=20)
         
         # Plot Hamiltonian path with connecting lines
-        path_lats = [self.cell_lookup[base].latitude for base in hamiltonian_path]
-        path_lngs = [self.cell_lookup[base].longitude for base in hamiltonian_path]
+        path_lngs, path_lats, hex_mask = self._cell_arrays(hamiltonian_path)
         
         # Plot the path
         ax2.plot(path_lngs, path_lats, 'g-', linewidth=1.5, alpha=0.7, label='Hamiltonian Path')
         
-        # Plot cells with new position numbers
-        for i, base_num in enumerate(hamiltonian_path):
-            cell = self.cell_lookup[base_num]
-            
-            # Color by cell type
-            if cell.cell_type == 'hexagon':
-                ax2.scatter(cell.longitude, cell.latitude, c='lightgreen', s=60, 
-                           marker='h', edgecolor='darkgreen', linewidth=1, alpha=0.8)
-                text_color = 'darkgreen'
-            else:  # pentagon
-                ax2.scatter(cell.longitude, cell.latitude, c='orange', s=70, 
-                           marker='p', edgecolor='darkorange', linewidth=1, alpha=0.9)
-                text_color = 'darkorange'
-            
-            # Add new position number
-            ax2.annotate(str(i), (cell.longitude, cell.latitude), 
+        # Plot cells - one scatter per cell type
+        ax2.scatter(path_lngs[hex_mask], path_lats[hex_mask], c='lightgreen', s=60, 
+                   marker='h', edgecolor='darkgreen', linewidth=1, alpha=0.8)
+        ax2.scatter(path_lngs[~hex_mask], path_lats[~hex_mask], c='orange', s=70, 
+                   marker='p', edgecolor='darkorange', linewidth=1, alpha=0.9)
+        
+        # Add new position numbers
+        for i, (lng, lat, is_hex) in enumerate(zip(path_lngs, path_lats, hex_mask)):
+            ax2.annotate(str(i), (lng, lat), 
                         xytext=(0, 0), textcoords='offset points',
                         fontsize=6, fontweight='bold', color='white', 
                         ha='center', va='center',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor=text_color, alpha=0.8))
+                        bbox=dict(boxstyle='round,pad=0.2', facecolor='darkgreen' if is_hex else 'darkorange', alpha=0.8))
         
         # Mark start and end
-        start_cell = self.cell_lookup[hamiltonian_path[0]]
-        end_cell = self.cell_lookup[hamiltonian_path[-1]]
+        start_cell = self.cells_by_num[hamiltonian_path[0]]
+        end_cell = self.cells_by_num[hamiltonian_path[-1]]
         ax2.scatter(start_cell.longitude, start_cell.latitude, c='red', s=120, 
                    marker='*', edgecolor='darkred', linewidth=2, label='Start', zorder=5)
         ax2.scatter(end_cell.longitude, end_cell.latitude, c='blue', s=120, 
@@ -184,9 +177,9 @@ ORDERING TRANSFORMATION RESULTS
    ✅ Theoretical maximum achieved
 
 🔢 TRANSFORMATION:
-   Cell 0 → Position {hamiltonian_path.index(0) if 0 in hamiltonian_path else 'N/A'}
-   Cell 1 → Position {hamiltonian_path.index(1) if 1 in hamiltonian_path else 'N/A'}
-   Cell 121 → Position {hamiltonian_path.index(121) if 121 in hamiltonian_path else 'N/A'}
+   Cell 0 → Position {positions.get(0, 'N/A')}
+   Cell 1 → Position {positions.get(1, 'N/A')}
+   Cell 121 → Position {positions.get(121, 'N/A')}
    Start: Cell {hamiltonian_path[0]} → Position 0
    End: Cell {hamiltonian_path[-1]} → Position 121
 """
@@ -197,45 +190,54 @@ ORDERING TRANSFORMATION RESULTS
         
         plt.tight_layout()
         
-        # Save files
-        os.makedirs(output_dir, exist_ok=True)
-        plt.savefig(os.path.join(output_dir, 'h3_ordering_comparison.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.savefig(os.path.join(output_dir, 'h3_ordering_comparison.pdf'), 
-                   bbox_inches='tight', facecolor='white')
+        # Measure the tight bounding box once (same padding as bbox_inches='tight')
+        # so each save is a single render instead of a measuring pass plus a render
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
         
-        plt.close()
+        # Save files (one render per requested format)
+        os.makedirs(output_dir, exist_ok=True)
+        for fmt in formats:
+            filename = f'h3_ordering_comparison.{fmt}'
+            fig.savefig(os.path.join(output_dir, filename), 
+                        dpi=dpi, bbox_inches=bbox, facecolor='white')
+            print(f"   ✅ Saved: {filename}")
         
-        print("   ✅ Saved: h3_ordering_comparison.png")
-        print("   ✅ Saved: h3_ordering_comparison.pdf")
+        plt.close(fig)
         
         return {
             'original_adjacency': original_adjacency,
             'hamiltonian_adjacency': hamiltonian_adjacency,
-            'improvement_factor': improvement_factor
+            'improvement_factor': improvement_factor,
+            'position_map': positions
         }
     
+    def _cell_arrays(self, cell_order) -> tuple:
+        """Return longitude, latitude and hexagon-mask arrays for a cell ordering."""
+        ordered_cells = [self.cells_by_num[base_num] for base_num in cell_order]
+        lngs = np.array([cell.longitude for cell in ordered_cells])
+        lats = np.array([cell.latitude for cell in ordered_cells])
+        hex_mask = np.array([cell.cell_type == 'hexagon' for cell in ordered_cells])
+        return lngs, lats, hex_mask
+    
     def _calculate_adjacency_rate(self, cell_order: list) -> float:
         """Calculate adjacency rate for a given cell ordering."""
-        adjacent_count = 0
+        key = tuple(cell_order)
+        if key in self._adjacency_cache:
+            return self._adjacency_cache[key]
+        
         total_pairs = len(cell_order) - 1
         
-        for i in range(total_pairs):
-            cell1_id = self.cell_lookup[cell_order[i]].cell_id
-            cell2_id = self.cell_lookup[cell_order[i + 1]].cell_id
-            
-            # Check H3 adjacency
-            try:
-                import h3
-                neighbors = h3.grid_ring(cell1_id, 1)
-                if cell2_id in neighbors:
-                    adjacent_count += 1
-            except:
-                pass
-        
-        return (adjacent_count / total_pairs) * 100 if total_pairs > 0 else 0
+        adjacent_count = sum(
+            1 for i in range(total_pairs)
+            if self.cells_by_num[cell_order[i + 1]].cell_id in self._neighbors[self.cells_by_num[cell_order[i]].cell_id]
+        )
+        
+        rate = (adjacent_count / total_pairs) * 100 if total_pairs > 0 else 0
+        self._adjacency_cache[key] = rate
+        return rate
     
-    def create_text_comparison(self, hamiltonian_path: list, output_path: str):
+    def create_text_comparison(self, hamiltonian_path: list, output_path: str, positions: dict = None,
+                               original_adjacency: float = None, hamiltonian_adjacency: float = None):
         """Create text file comparing old and new indices with coordinates."""
         
         print("📝 Creating Text Comparison File")
@@ -247,24 +249,28 @@ ORDERING TRANSFORMATION RESULTS
             f.write("Format: Old_Index → New_Index | Latitude, Longitude | Cell_Type\n")
             f.write("-" * 70 + "\n\n")
             
-            # Create mapping from original to new position
-            position_map = {cell: pos for pos, cell in enumerate(hamiltonian_path)}
+            # Create mapping from original to new position unless one was provided
+            if positions is None:
+                positions = position_map(hamiltonian_path)
             
-            # Write comparison for each cell
-            for old_idx in range(122):
-                if old_idx in position_map:
-                    new_idx = position_map[old_idx]
-                    cell = self.cell_lookup[old_idx]
-                    
+            # Write comparison for each cell (in base cell order)
+            for old_idx, cell in enumerate(self.cells_by_num):
+                new_idx = positions.get(old_idx)
+                if new_idx is not None:
                     f.write(f"{old_idx:3d} → {new_idx:3d} | "
                            f"{cell.latitude:7.2f}, {cell.longitude:8.2f} | "
                            f"{cell.cell_type}\n")
             
+            if original_adjacency is None:
+                original_adjacency = self._calculate_adjacency_rate(tuple(range(122)))
+            if hamiltonian_adjacency is None:
+                hamiltonian_adjacency = self._calculate_adjacency_rate(hamiltonian_path)
+            
             f.write("\n" + "=" * 70 + "\n")
             f.write("SUMMARY:\n")
             f.write(f"Total cells: 122\n")
-            f.write(f"Original adjacency: {self._calculate_adjacency_rate(list(range(122))):.1f}%\n")
-            f.write(f"Hamiltonian adjacency: {self._calculate_adjacency_rate(hamiltonian_path):.1f}%\n")
+            f.write(f"Original adjacency: {original_adjacency:.1f}%\n")
+            f.write(f"Hamiltonian adjacency: {hamiltonian_adjacency:.1f}%\n")
             f.write(f"Path: {hamiltonian_path[0]} → ... → {hamiltonian_path[-1]}\n")
         
         print(f"   ✅ Saved: {output_path}")
@@ -275,47 +281,34 @@ ORDERING TRANSFORMATION RESULTS
         print("🗺️  Creating Coordinate-to-Syllable Mapping")
         print("=" * 45)
         
-        # Create mapping configuration
+        positions = position_map(hamiltonian_path)
+        path_cells = [self.cells_by_num[original_cell] for original_cell in hamiltonian_path]
+        
+        # Create mapping configuration. Per-position data is stored as parallel
+        # arrays indexed by Hamiltonian position; hamiltonian_path itself maps
+        # position -> original cell.
         mapping_config = {
             "name": "h3_coordinate_mapping",
             "description": "Mapping from H3 level 0 coordinates to Hamiltonian path positions for syllable addressing",
-            "version": "1.0.0",
+            "version": "2.0.0",
             "type": "coordinate_mapping",
             "hamiltonian_path": hamiltonian_path,
-            "mappings": {
-                "original_to_hamiltonian": {},
-                "hamiltonian_to_original": {},
-                "coordinate_to_position": {},
-                "position_to_coordinate": {}
+            "original_to_hamiltonian": [positions[original_cell] for original_cell in range(len(hamiltonian_path))],
+            "positions": {
+                "latitude": [cell.latitude for cell in path_cells],
+                "longitude": [cell.longitude for cell in path_cells],
+                "cell_type": [cell.cell_type for cell in path_cells]
+            },
+            "coordinate_to_position": {
+                f"{cell.latitude:.6f},{cell.longitude:.6f}": new_pos
+                for new_pos, cell in enumerate(path_cells)
             }
         }
         
-        # Fill mappings
-        for new_pos, original_cell in enumerate(hamiltonian_path):
-            cell = self.cell_lookup[original_cell]
-            
-            # Original to Hamiltonian position
-            mapping_config["mappings"]["original_to_hamiltonian"][str(original_cell)] = new_pos
-            
-            # Hamiltonian position to original
-            mapping_config["mappings"]["hamiltonian_to_original"][str(new_pos)] = original_cell
-            
-            # Coordinate to position
-            coord_key = f"{cell.latitude:.6f},{cell.longitude:.6f}"
-            mapping_config["mappings"]["coordinate_to_position"][coord_key] = new_pos
-            
-            # Position to coordinate
-            mapping_config["mappings"]["position_to_coordinate"][str(new_pos)] = {
-                "latitude": cell.latitude,
-                "longitude": cell.longitude,
-                "original_cell": original_cell,
-                "cell_type": cell.cell_type
-            }
-        
         # Save configuration
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(mapping_config, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(dumps_json(mapping_config))
         
         print(f"   ✅ Saved: {output_path}")
         
@@ -351,7 +344,10 @@ def main():
     comparison_results = comparator.create_comparison_visualization(hamiltonian_path, output_dir)
     
     # Create text comparison
-    comparator.create_text_comparison(hamiltonian_path, text_output)
+    comparator.create_text_comparison(hamiltonian_path, text_output,
+                                      comparison_results['position_map'],
+                                      comparison_results['original_adjacency'],
+                                      comparison_results['hamiltonian_adjacency'])
     
     # Create coordinate mapping
     mapping_config = comparator.create_coordinate_mapping(hamiltonian_path, mapping_output)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+H3 Level 0 Adjacency Constants Generator
+
+Computes the adjacency of the 122 H3 level 0 cells once and writes it as
+Python constants, so the Hamiltonian path search can start without querying
+the H3 library. The level 0 grid is fixed; regenerate only if the H3 library
+ever reports different neighbors.
+"""
+
+import sys
+import os
+import h3
+
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '_adj_constants.py')
+
+HEADER = '''"""
+H3 level 0 adjacency constants - Auto-generated
+
+This file is automatically generated by scripts/hamiltonian/generate_adjacency_constants.py
+Do not edit manually.
+
+All tuples are indexed by base cell number (0-121):
+- ADJACENCY: neighbors of each cell, in base cell order
+- ADJACENCY_MASKS: bit n set when base cell n is a neighbor
+- NEIGHBORS_BY_DEGREE: neighbors sorted by degree, most constrained first
+"""
+
+'''
+
+
+def build_adjacency() -> list:
+    """Return the neighbor lists of all level 0 cells, indexed by base cell number."""
+    cells = sorted(h3.get_res0_cells(), key=h3.get_base_cell_number)
+    id_to_base = {cell: h3.get_base_cell_number(cell) for cell in cells}
+    
+    adjacency = [None] * len(cells)
+    for cell in cells:
+        neighbors = [id_to_base[n] for n in h3.grid_ring(cell, 1) if n in id_to_base and n != cell]
+        adjacency[id_to_base[cell]] = sorted(neighbors)
+    return adjacency
+
+
+def format_constants(adjacency: list) -> str:
+    """Render the adjacency as the contents of _adj_constants.py."""
+    masks = [sum(1 << neighbor for neighbor in neighbors) for neighbors in adjacency]
+    by_degree = [sorted(neighbors, key=lambda neighbor: len(adjacency[neighbor])) for neighbors in adjacency]
+    
+    lines = [HEADER]
+    lines.append("ADJACENCY = (\n")
+    lines.extend(f"    {tuple(neighbors)},\n" for neighbors in adjacency)
+    lines.append(")\n\nADJACENCY_MASKS = (\n")
+    lines.extend(f"    {mask:#x},\n" for mask in masks)
+    lines.append(")\n\nNEIGHBORS_BY_DEGREE = (\n")
+    lines.extend(f"    {tuple(neighbors)},\n" for neighbors in by_degree)
+    lines.append(")\n")
+    return ''.join(lines)
+
+
+def main():
+    """Generate the level 0 adjacency constants file."""
+    
+    print("🔗 Generating H3 Level 0 Adjacency Constants")
+    print("=" * 45)
+    
+    adjacency = build_adjacency()
+    
+    with open(OUTPUT_PATH, 'w') as f:
+        f.write(format_constants(adjacency))
+    
+    print(f"   Total cells: {len(adjacency)}")
+    print(f"   Total edges: {sum(len(neighbors) for neighbors in adjacency) // 2}")
+    print(f"   ✅ Saved: {OUTPUT_PATH}")
+    
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -13,73 +13,139 @@ import sys
 import os
 import h3
 import time
-import json
-from typing import List, Dict, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Optional
 
-# Add the package source to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python', 'src'))
-from h3_syllable.h3_level0_reorganizer import H3Level0Reorganizer
+# Add the shared script helpers to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from _json_io import dumps_json
+from _level0 import get_level0_cells
+
+# Precomputed level 0 adjacency (see generate_adjacency_constants.py)
+try:
+    import _adj_constants
+except ImportError:
+    _adj_constants = None
+
+
+_worker_generator = None
+_worker_first_found = None
+
+
+def _init_search_worker(adjacency_graph, adjacency_mask, neighbors_by_degree, first_found):
+    """Process pool initializer: rebuild the search state once per worker."""
+    global _worker_generator, _worker_first_found
+    generator = H3HamiltonianOrderingGenerator.__new__(H3HamiltonianOrderingGenerator)
+    generator.adjacency_graph = adjacency_graph
+    generator.adjacency_mask = adjacency_mask
+    generator.neighbors_by_degree = neighbors_by_degree
+    _worker_generator = generator
+    _worker_first_found = first_found
+
+
+def _search_from_start(index: int, start_cell: int, start_time: float, max_time: int) -> Optional[List[int]]:
+    """Process pool task: search from one start cell, giving up once an earlier start succeeds."""
+    first_found = _worker_first_found
+    
+    def earlier_start_succeeded() -> bool:
+        return first_found.value < index
+    
+    if earlier_start_succeeded():
+        return None
+    
+    path = _worker_generator._backtrack_search(start_cell, start_time, max_time, earlier_start_succeeded)
+    if path:
+        with first_found.get_lock():
+            first_found.value = min(first_found.value, index)
+    return path
 
 
 class H3HamiltonianOrderingGenerator:
     """Generates optimal Hamiltonian path ordering for H3 level 0 cells."""
     
     def __init__(self):
-        self.reorganizer = H3Level0Reorganizer()
-        self.cells = self.reorganizer.get_all_level0_cells()
-        self.cell_lookup = {cell.base_cell_number: cell for cell in self.cells}
-        self.adjacency_graph = self._build_adjacency_graph()
-        
-    def _build_adjacency_graph(self) -> Dict[int, List[int]]:
+        self.reorganizer, self.cells = get_level0_cells()
+        
+        # Base cell numbers are the contiguous range 0-121, so per-cell data
+        # lives in lists indexed by base cell number
+        self.cell_lookup = [None] * len(self.cells)
+        for cell in self.cells:
+            self.cell_lookup[cell.base_cell_number] = cell
+        self.id_to_base = {cell.cell_id: cell.base_cell_number for cell in self.cells}
+        
+        # Bitmask view of the graph for the backtracking search: bit n of
+        # adjacency_mask[cell] is set when base cell n neighbors cell, and each
+        # cell's neighbors are pre-sorted by degree (most constrained first)
+        if _adj_constants is not None and len(_adj_constants.ADJACENCY) == len(self.cells):
+            print("🔗 Loading precomputed H3 adjacency graph...")
+            self.adjacency_graph = [list(neighbors) for neighbors in _adj_constants.ADJACENCY]
+            self.adjacency_mask = list(_adj_constants.ADJACENCY_MASKS)
+            self.neighbors_by_degree = [list(neighbors) for neighbors in _adj_constants.NEIGHBORS_BY_DEGREE]
+        else:
+            print("🔗 Building H3 adjacency graph...")
+            self.adjacency_graph = self._build_adjacency_graph()
+            self.adjacency_mask = [
+                sum(1 << neighbor for neighbor in neighbors)
+                for neighbors in self.adjacency_graph
+            ]
+            self.neighbors_by_degree = [
+                sorted(neighbors, key=lambda neighbor: len(self.adjacency_graph[neighbor]))
+                for neighbors in self.adjacency_graph
+            ]
+        
+        self._print_graph_stats()
+        
+    def _build_adjacency_graph(self) -> List[List[int]]:
         """Build adjacency graph for all H3 level 0 cells."""
-        print("🔗 Building H3 adjacency graph...")
+        # Neighbors are listed in cell order, which keeps the search deterministic
+        cell_position = {cell.cell_id: i for i, cell in enumerate(self.cells)}
         
-        graph = {cell.base_cell_number: [] for cell in self.cells}
+        # Build adjacency relationships - one ring lookup per cell
+        graph = [None] * len(self.cells)
+        for cell in self.cells:
+            ring = [n for n in h3.grid_ring(cell.cell_id, 1) if n in self.id_to_base and n != cell.cell_id]
+            ring.sort(key=cell_position.__getitem__)
+            graph[cell.base_cell_number] = [self.id_to_base[n] for n in ring]
         
-        # Build adjacency relationships
-        for i, cell1 in enumerate(self.cells):
-            for j, cell2 in enumerate(self.cells):
-                if i != j:
-                    if self._check_h3_adjacency(cell1.cell_id, cell2.cell_id):
-                        graph[cell1.base_cell_number].append(cell2.base_cell_number)
-        
-        # Print graph statistics
-        total_edges = sum(len(neighbors) for neighbors in graph.values()) // 2
-        degrees = [len(neighbors) for neighbors in graph.values()]
+        return graph
+    
+    def _print_graph_stats(self):
+        """Print adjacency graph statistics."""
+        total_edges = sum(len(neighbors) for neighbors in self.adjacency_graph) // 2
+        degrees = [len(neighbors) for neighbors in self.adjacency_graph]
         
-        print(f"   Total cells: {len(graph)}")
+        print(f"   Total cells: {len(self.adjacency_graph)}")
         print(f"   Total edges: {total_edges}")
         print(f"   Average degree: {sum(degrees) / len(degrees):.1f}")
         print(f"   Degree range: {min(degrees)} - {max(degrees)}")
-        
-        return graph
-    
-    def _check_h3_adjacency(self, cell1_id: str, cell2_id: str) -> bool:
-        """Check if two H3 cells are actually adjacent (neighbors)."""
-        try:
-            neighbors = h3.grid_ring(cell1_id, 1)
-            return cell2_id in neighbors
-        except:
-            return False
     
-    def find_hamiltonian_path(self, max_time: int = 300) -> Optional[List[int]]:
+    def find_hamiltonian_path(self, max_time: int = 300, workers: int = 1) -> Optional[List[int]]:
         """
         Find Hamiltonian path using backtracking with optimizations.
         
+        Args:
+            max_time: Maximum time to spend searching (seconds)
+            workers: Number of processes searching start cells in parallel; the
+                result is the same as the sequential search
+        
         Returns:
             List of cell numbers in optimal order, or None if not found
         """
         print(f"🔍 Finding Hamiltonian path (max {max_time}s)...")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Try cells with different degrees (start with most constrained)
-        degrees = [(cell_num, len(neighbors)) for cell_num, neighbors in self.adjacency_graph.items()]
+        degrees = [(cell_num, len(neighbors)) for cell_num, neighbors in enumerate(self.adjacency_graph)]
         degrees.sort(key=lambda x: x[1])  # Sort by degree
         
         # Try low degree cells first (more constrained)
         candidates = [cell for cell, degree in degrees[:10]]
         
+        if workers > 1:
+            return self._parallel_search(candidates, start_time, max_time, workers)
+        
         for start_candidate in candidates:
             print(f"   Trying start cell: {start_candidate} (degree: {len(self.adjacency_graph[start_candidate])})")
             
@@ -88,57 +154,150 @@ class H3HamiltonianOrderingGenerator:
                 return path
             
             # Check if we've exceeded time limit
-            if time.time() - start_time > max_time:
+            if time.monotonic() - start_time > max_time:
                 print(f"   Time limit exceeded ({max_time}s)")
                 break
         
         return None
     
-    def _backtrack_search(self, start_cell: int, start_time: float, max_time: int) -> Optional[List[int]]:
-        """Perform backtracking search from a specific starting cell."""
+    def _parallel_search(self, candidates: List[int], start_time: float, max_time: int,
+                         workers: int) -> Optional[List[int]]:
+        """
+        Search from every start candidate in a process pool.
         
-        visited = set()
-        path = []
+        Returns the path of the first candidate (in candidate order) that has one,
+        so the result matches the sequential search; later searches stop early.
+        """
+        print(f"   Searching {len(candidates)} start cells with {workers} workers")
+        
+        first_found = multiprocessing.Value('i', len(candidates))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_search_worker,
+                                 initargs=(self.adjacency_graph, self.adjacency_mask,
+                                           self.neighbors_by_degree, first_found)) as executor:
+            futures = [executor.submit(_search_from_start, i, start_candidate, start_time, max_time)
+                       for i, start_candidate in enumerate(candidates)]
+            
+            for start_candidate, future in zip(candidates, futures):
+                path = future.result()
+                if path:
+                    for pending in futures:
+                        pending.cancel()
+                    return path
+        
+        if time.monotonic() - start_time > max_time:
+            print(f"   Time limit exceeded ({max_time}s)")
+        return None
+    
+    def _backtrack_search(self, start_cell: int, start_time: float, max_time: int,
+                          should_stop: Optional[Callable[[], bool]] = None) -> Optional[List[int]]:
+        """Perform backtracking search from a specific starting cell."""
         
-        def backtrack(current_cell: int, depth: int) -> bool:
-            # Check time limit
-            if time.time() - start_time > max_time:
-                return False
+        full_mask = (1 << len(self.adjacency_graph)) - 1
+        adjacency_mask = self.adjacency_mask
+        neighbors_by_degree = self.neighbors_by_degree
+        
+        # Explicit DFS stack: path[d] is the cell at depth d and next_index[d] is
+        # the position of the next neighbor of path[d] to try
+        path = [start_cell]
+        next_index = [0]
+        visited_mask = 1 << start_cell
+        steps = 0
+        deepest = 0
+        
+        print(f"      Depth {0:3d}: Cell {start_cell:3d} ({time.monotonic() - start_time:.1f}s)")
+        
+        while visited_mask != full_mask:
+            # Check time limit and stop request (only every 65536 steps)
+            steps += 1
+            if not steps & 0xFFFF and (time.monotonic() - start_time > max_time
+                                       or (should_stop is not None and should_stop())):
+                return None
             
-            # Add current cell to path
-            path.append(current_cell)
-            visited.add(current_cell)
+            depth = len(path) - 1
+            current_cell = path[depth]
+            neighbors = neighbors_by_degree[current_cell]
             
-            # Progress reporting
-            if depth % 20 == 0 or depth < 10:
-                elapsed = time.time() - start_time
-                print(f"      Depth {depth:3d}: Cell {current_cell:3d} ({elapsed:.1f}s)")
+            # Find the next unvisited neighbor, low-degree nodes first (more constrained)
+            i = next_index[depth]
+            if adjacency_mask[current_cell] & ~visited_mask:
+                while i < len(neighbors) and (visited_mask >> neighbors[i]) & 1:
+                    i += 1
+            else:
+                i = len(neighbors)
             
-            # Check if we've visited all cells
-            if len(visited) == len(self.cells):
-                print(f"   ✅ Found Hamiltonian path! Length: {len(path)}")
-                return True
+            if i == len(neighbors):
+                # Dead end - backtrack
+                path.pop()
+                next_index.pop()
+                visited_mask &= ~(1 << current_cell)
+                if not path:
+                    return None
+                continue
             
-            # Try all unvisited neighbors
-            neighbors = self.adjacency_graph[current_cell]
+            next_index[depth] = i + 1
+            neighbor = neighbors[i]
             
-            # Sort neighbors by degree (visit low-degree nodes first - more constrained)
-            neighbors_with_degree = [(neighbor, len(self.adjacency_graph[neighbor])) 
-                                   for neighbor in neighbors if neighbor not in visited]
-            neighbors_with_degree.sort(key=lambda x: x[1])
+            # Skip neighbors after which the remaining cells cannot form a path
+            remaining_mask = full_mask & ~(visited_mask | (1 << neighbor))
+            if remaining_mask and not self._can_complete(neighbor, remaining_mask):
+                continue
             
-            for neighbor, _ in neighbors_with_degree:
-                if neighbor not in visited:
-                    if backtrack(neighbor, depth + 1):
-                        return True
+            # Descend into the neighbor
+            path.append(neighbor)
+            next_index.append(0)
+            visited_mask |= 1 << neighbor
             
-            # Backtrack
-            path.pop()
-            visited.remove(current_cell)
-            return False
+            # Progress reporting (only the first time each depth is reached, so
+            # backtracking over the same depths does not flood the output)
+            depth += 1
+            if depth > deepest:
+                deepest = depth
+                if depth % 20 == 0 or depth < 10:
+                    elapsed = time.monotonic() - start_time
+                    print(f"      Depth {depth:3d}: Cell {neighbor:3d} ({elapsed:.1f}s)")
+        
+        print(f"   ✅ Found Hamiltonian path! Length: {len(path)}")
+        return path
+    
+    def _can_complete(self, current_cell: int, remaining_mask: int) -> bool:
+        """
+        Check whether a path from current_cell could still cover every remaining cell.
         
-        success = backtrack(start_cell, 0)
-        return path if success else None
+        Prunes branches where a remaining cell has no way in or out, more than one
+        remaining cell would have to be the path's end, or the remaining cells are
+        not all reachable from current_cell.
+        """
+        adjacency_mask = self.adjacency_mask
+        current_bit = 1 << current_cell
+        
+        # Degree check: count each remaining cell's links to remaining cells and
+        # the current cell; only the final cell of the path may have fewer than two
+        dead_ends = 0
+        pending = remaining_mask
+        while pending:
+            low_bit = pending & -pending
+            pending ^= low_bit
+            links = bin(adjacency_mask[low_bit.bit_length() - 1] & (remaining_mask | current_bit)).count('1')
+            if links == 0:
+                return False
+            if links == 1:
+                dead_ends += 1
+                if dead_ends > 1:
+                    return False
+        
+        # Connectivity check: flood fill the remaining cells from current_cell
+        reached = current_bit
+        frontier = current_bit
+        while frontier:
+            expanded = 0
+            while frontier:
+                low_bit = frontier & -frontier
+                frontier ^= low_bit
+                expanded |= adjacency_mask[low_bit.bit_length() - 1]
+            frontier = expanded & remaining_mask & ~reached
+            reached |= frontier
+        
+        return remaining_mask & ~reached == 0
     
     def validate_path(self, path: List[int]) -> Dict:
         """Validate that the path is a perfect Hamiltonian path."""
@@ -160,16 +319,10 @@ class H3HamiltonianOrderingGenerator:
             print(f"   ❌ Missing cells: {expected_cells - path_cells}")
             return {'valid': False, 'error': 'Missing cells'}
         
-        # Check adjacency
-        adjacent_count = 0
+        # Check adjacency (bit test against each cell's neighbor mask)
+        adjacency_mask = self.adjacency_mask
         total_pairs = len(path) - 1
-        
-        for i in range(total_pairs):
-            cell1 = path[i]
-            cell2 = path[i + 1]
-            
-            if cell2 in self.adjacency_graph[cell1]:
-                adjacent_count += 1
+        adjacent_count = sum((adjacency_mask[cell1] >> cell2) & 1 for cell1, cell2 in zip(path, path[1:]))
         
         adjacency_rate = (adjacent_count / total_pairs) * 100 if total_pairs > 0 else 0
         
@@ -196,23 +349,19 @@ class H3HamiltonianOrderingGenerator:
     def generate_ordering_config(self, path: List[int]) -> Dict:
         """Generate the configuration for the H3 syllable package."""
         
-        # Create position mapping
-        position_map = {original_cell: new_position for new_position, original_cell in enumerate(path)}
-        
-        # Create reverse mapping
+        # Only the order is stored; _level0.position_map(config['cell_order']) gives the inverse
         cell_order = path.copy()
         
         # Add metadata
         config = {
             'name': 'hamiltonian_path',
             'description': 'Perfect Hamiltonian path ordering for H3 level 0 cells with 100% adjacency rate',
-            'version': '1.0.0',
+            'version': '2.0.0',
             'type': 'hamiltonian_path',
             'adjacency_rate': 100.0,
             'total_cells': len(path),
             'algorithm': 'backtracking_hamiltonian_path',
             'cell_order': cell_order,
-            'position_map': position_map,
             'metadata': {
                 'start_cell': path[0],
                 'end_cell': path[-1],
@@ -228,18 +377,20 @@ class H3HamiltonianOrderingGenerator:
         """Save the ordering configuration to a JSON file."""
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(dumps_json(config))
         
         print(f"💾 Saved ordering config to: {output_path}")
     
-    def generate_hamiltonian_ordering(self, output_path: str = None, max_time: int = 300) -> Optional[Dict]:
+    def generate_hamiltonian_ordering(self, output_path: str = None, max_time: int = 300,
+                                      workers: int = 1) -> Optional[Dict]:
         """
         Main function to generate the optimal Hamiltonian path ordering.
         
         Args:
             output_path: Where to save the configuration (optional)
             max_time: Maximum time to spend searching (seconds)
+            workers: Number of processes searching start cells in parallel
             
         Returns:
             Configuration dictionary or None if no path found
@@ -248,7 +399,7 @@ class H3HamiltonianOrderingGenerator:
         print("=" * 50)
         
         # Find the Hamiltonian path
-        path = self.find_hamiltonian_path(max_time)
+        path = self.find_hamiltonian_path(max_time, workers)
         
         if not path:
             print("❌ No Hamiltonian path found within time limit")
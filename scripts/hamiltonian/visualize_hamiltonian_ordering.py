@@ -9,30 +9,51 @@ through all 122 H3 level 0 cells.
 
 import sys
 import os
-import json
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Add the package source to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python', 'src'))
-from h3_syllable.h3_level0_reorganizer import H3Level0Reorganizer
+# Add the shared script helpers to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from _json_io import loads_json
+from _level0 import get_level0_cells
 
 
 class HamiltonianPathVisualizer:
     """Creates visualizations of the Hamiltonian path ordering."""
     
     def __init__(self):
-        self.reorganizer = H3Level0Reorganizer()
-        self.cells = self.reorganizer.get_all_level0_cells()
-        self.cell_lookup = {cell.base_cell_number: cell for cell in self.cells}
+        self.reorganizer, self.cells = get_level0_cells()
+        
+        # Coordinates indexed by base cell number, for fancy indexing by path
+        size = max(cell.base_cell_number for cell in self.cells) + 1
+        self.lat_by_base = np.full(size, np.nan)
+        self.lng_by_base = np.full(size, np.nan)
+        for cell in self.cells:
+            self.lat_by_base[cell.base_cell_number] = cell.latitude
+            self.lng_by_base[cell.base_cell_number] = cell.longitude
     
     def load_hamiltonian_config(self, config_path: str) -> dict:
         """Load the Hamiltonian path configuration."""
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        return config
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        return loads_json(data)
     
-    def create_hamiltonian_visualization(self, hamiltonian_path: list, output_dir: str):
+    def _path_coordinates(self, hamiltonian_path: list) -> tuple:
+        """Return latitude and longitude arrays for the cells of a path, in path order."""
+        path = np.asarray(hamiltonian_path, dtype=np.intp)
+        return self.lat_by_base[path], self.lng_by_base[path]
+    
+    def _save_figure(self, fig, base_path: str, dpi: int = 150):
+        """Save a figure as PNG and PDF, measuring the tight bounding box only once."""
+        # Same crop as bbox_inches='tight', without a measuring pass per save
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+        # 150 dpi suits on-screen/documentation use; pass 300 for print quality
+        fig.savefig(f"{base_path}.png", dpi=dpi, bbox_inches=bbox, facecolor='white')
+        # Rasterized path/cell layers are embedded in the PDF at 200 dpi
+        fig.savefig(f"{base_path}.pdf", dpi=200, bbox_inches=bbox, facecolor='white')
+        plt.close(fig)
+    
+    def create_hamiltonian_visualization(self, hamiltonian_path: list, output_dir: str, dpi: int = 150):
         """Create comprehensive visualization of the Hamiltonian path."""
         
         print("🎨 Creating Hamiltonian Path Visualization")
@@ -46,16 +67,16 @@ class HamiltonianPathVisualizer:
                       fontsize=14, fontweight='bold', pad=20)
         
         # Get coordinates in path order
-        path_lats = [self.cell_lookup[base].latitude for base in hamiltonian_path]
-        path_lngs = [self.cell_lookup[base].longitude for base in hamiltonian_path]
+        path_lats, path_lngs = self._path_coordinates(hamiltonian_path)
         
         # Plot path as continuous line
-        ax1.plot(path_lngs, path_lats, 'b-', linewidth=1, alpha=0.7, label='Hamiltonian Path')
+        ax1.plot(path_lngs, path_lats, 'b-', linewidth=1, alpha=0.7, label='Hamiltonian Path',
+                 rasterized=True)
         
-        # Plot cells with gradient colors
-        colors = plt.cm.viridis(np.linspace(0, 1, len(hamiltonian_path)))
-        ax1.scatter(path_lngs, path_lats, c=colors, s=30, edgecolor='black', 
-                   linewidth=0.5, alpha=0.8, zorder=3)
+        # Plot cells with gradient colors (colormapped by path position)
+        positions = np.arange(len(hamiltonian_path))
+        ax1.scatter(path_lngs, path_lats, c=positions, cmap='viridis', s=30, edgecolor='black', 
+                   linewidth=0.5, alpha=0.8, zorder=3, rasterized=True)
         
         # Mark start and end
         ax1.scatter(path_lngs[0], path_lats[0], c='red', s=100, marker='*', 
@@ -75,20 +96,20 @@ class HamiltonianPathVisualizer:
                       fontsize=14, fontweight='bold', pad=20)
         
         # Plot first 50 cells with numbers
-        first_50 = hamiltonian_path[:50]
-        first_50_lats = [self.cell_lookup[base].latitude for base in first_50]
-        first_50_lngs = [self.cell_lookup[base].longitude for base in first_50]
+        first_50_lats, first_50_lngs = path_lats[:50], path_lngs[:50]
         
         # Plot path segments
-        ax2.plot(first_50_lngs, first_50_lats, 'g-', linewidth=2, alpha=0.8, label='Path Segment')
-        
-        # Plot cells with numbers
-        for i, (base, lat, lng) in enumerate(zip(first_50, first_50_lats, first_50_lngs)):
-            ax2.scatter(lng, lat, c='lightgreen', s=100, edgecolor='darkgreen', 
-                       linewidth=1, alpha=0.9)
-            ax2.annotate(str(i), (lng, lat), xytext=(0, 0), textcoords='offset points',
-                        fontsize=8, fontweight='bold', color='darkgreen', 
-                        ha='center', va='center')
+        ax2.plot(first_50_lngs, first_50_lats, 'g-', linewidth=2, alpha=0.8, label='Path Segment',
+                 rasterized=True)
+        
+        # Plot cells in one scatter, then number them
+        ax2.scatter(first_50_lngs, first_50_lats, c='lightgreen', s=100, edgecolor='darkgreen', 
+                   linewidth=1, alpha=0.9, rasterized=True)
+        label_style = dict(xytext=(0, 0), textcoords='offset points',
+                           fontsize=8, fontweight='bold', color='darkgreen', 
+                           ha='center', va='center')
+        for i, (lat, lng) in enumerate(zip(first_50_lats, first_50_lngs)):
+            ax2.annotate(str(i), (lng, lat), **label_style)
         
         # Mark start
         ax2.scatter(first_50_lngs[0], first_50_lats[0], c='red', s=150, marker='*', 
@@ -159,17 +180,12 @@ PERFECT HAMILTONIAN PATH ACHIEVED!
         
         # Save files
         os.makedirs(output_dir, exist_ok=True)
-        plt.savefig(os.path.join(output_dir, 'h3_hamiltonian_path_complete.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.savefig(os.path.join(output_dir, 'h3_hamiltonian_path_complete.pdf'), 
-                   bbox_inches='tight', facecolor='white')
-        
-        plt.close()
+        self._save_figure(fig, os.path.join(output_dir, 'h3_hamiltonian_path_complete'), dpi)
         
         print("   ✅ Saved: h3_hamiltonian_path_complete.png")
         print("   ✅ Saved: h3_hamiltonian_path_complete.pdf")
     
-    def create_path_sequence_diagram(self, hamiltonian_path: list, output_dir: str):
+    def create_path_sequence_diagram(self, hamiltonian_path: list, output_dir: str, dpi: int = 150):
         """Create a focused diagram showing the path sequence."""
         
         print("📋 Creating Path Sequence Diagram")
@@ -182,16 +198,16 @@ PERFECT HAMILTONIAN PATH ACHIEVED!
                      fontsize=16, fontweight='bold', pad=20)
         
         # Get coordinates
-        path_lats = [self.cell_lookup[base].latitude for base in hamiltonian_path]
-        path_lngs = [self.cell_lookup[base].longitude for base in hamiltonian_path]
+        path_lats, path_lngs = self._path_coordinates(hamiltonian_path)
         
         # Plot the complete path
-        ax.plot(path_lngs, path_lats, 'b-', linewidth=2, alpha=0.8, label='Hamiltonian Path')
+        ax.plot(path_lngs, path_lats, 'b-', linewidth=2, alpha=0.8, label='Hamiltonian Path',
+                rasterized=True)
         
         # Plot cells with position-based colors
-        colors = plt.cm.plasma(np.linspace(0, 1, len(hamiltonian_path)))
-        scatter = ax.scatter(path_lngs, path_lats, c=colors, s=60, 
-                           edgecolor='black', linewidth=0.5, alpha=0.9, zorder=3)
+        positions = np.arange(len(hamiltonian_path))
+        scatter = ax.scatter(path_lngs, path_lats, c=positions, cmap='plasma', s=60, 
+                           edgecolor='black', linewidth=0.5, alpha=0.9, zorder=3, rasterized=True)
         
         # Mark start and end with special markers
         ax.scatter(path_lngs[0], path_lats[0], c='red', s=200, marker='*', 
@@ -226,17 +242,12 @@ PERFECT HAMILTONIAN PATH ACHIEVED!
         plt.tight_layout()
         
         # Save files
-        plt.savefig(os.path.join(output_dir, 'h3_hamiltonian_path_sequence.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.savefig(os.path.join(output_dir, 'h3_hamiltonian_path_sequence.pdf'), 
-                   bbox_inches='tight', facecolor='white')
-        
-        plt.close()
+        self._save_figure(fig, os.path.join(output_dir, 'h3_hamiltonian_path_sequence'), dpi)
         
         print("   ✅ Saved: h3_hamiltonian_path_sequence.png")
         print("   ✅ Saved: h3_hamiltonian_path_sequence.pdf")
     
-    def create_visualizations(self, config_path: str, output_dir: str):
+    def create_visualizations(self, config_path: str, output_dir: str, dpi: int = 150):
         """Create all visualizations for the Hamiltonian path."""
         
         print("🎨 H3 Hamiltonian Path Visualizations")
@@ -247,10 +258,10 @@ PERFECT HAMILTONIAN PATH ACHIEVED!
         hamiltonian_path = config['cell_order']
         
         # Create comprehensive visualization
-        self.create_hamiltonian_visualization(hamiltonian_path, output_dir)
+        self.create_hamiltonian_visualization(hamiltonian_path, output_dir, dpi)
         
         # Create sequence diagram
-        self.create_path_sequence_diagram(hamiltonian_path, output_dir)
+        self.create_path_sequence_diagram(hamiltonian_path, output_dir, dpi)
         
         print(f"\n🎉 VISUALIZATION SUCCESS:")
         print(f"   ✅ Perfect Hamiltonian path visualized")
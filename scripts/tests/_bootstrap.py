@@ -0,0 +1,18 @@
+"""
+Shared import setup for the test scripts.
+
+Puts the in-repo package source on the import path once, so every script
+tests the working tree rather than an installed release. With an editable
+install (pip install -e packages/python) this resolves to the same source.
+The scripts directory is added too, for helpers shared across script folders.
+"""
+
+import sys
+from pathlib import Path
+
+scripts_dir = Path(__file__).resolve().parent.parent
+package_src = scripts_dir.parent / "packages" / "python" / "src"
+
+for path in (scripts_dir, package_src):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
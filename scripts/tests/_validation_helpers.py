@@ -0,0 +1,30 @@
+"""
+Helpers shared by the validation test scripts.
+
+Conversions run in batches, falling back to single conversions only when a
+batch fails, and at most MAX_REPORTED_ERRORS error messages are kept.
+"""
+
+# Error messages kept per validation pass; a broken config repeats the same few
+MAX_REPORTED_ERRORS = 32
+
+
+def convert_all(convert_batch, convert_one, items: list) -> list:
+    """
+    Convert items with one batch call, falling back to single conversions
+    when the batch fails so the failing items can be reported.
+    
+    Returns the converted value, or the exception raised, for each item.
+    """
+    try:
+        return convert_batch(items)
+    except Exception:
+        pass
+    
+    converted = []
+    for item in items:
+        try:
+            converted.append(convert_one(item))
+        except Exception as e:
+            converted.append(e)
+    return converted
@@ -5,19 +5,28 @@ Tests the new configuration system and level 0 mapping
 """
 
 import sys
-import os
-import math
-from pathlib import Path
+import functools
 
 # Add the package source to path
-package_src = Path(__file__).parent.parent.parent / "packages" / "python" / "src"
-sys.path.insert(0, str(package_src))
+import _bootstrap  # noqa: F401
 
 from h3_syllable.h3_syllable_system import H3SyllableSystem
+from h3_syllable.utilities import haversine_distance
 
 
-def test_round_trip_conversion():
-    """Test that coordinates -> syllables -> coordinates works accurately."""
+@functools.lru_cache(maxsize=None)
+def _get_system(config_name: str) -> H3SyllableSystem:
+    """Build each configuration's system once per process and reuse it."""
+    return H3SyllableSystem(config_name)
+
+
+def test_round_trip_conversion(verbose: bool = False):
+    """
+    Test that coordinates -> syllables -> coordinates works accurately.
+    
+    Each config stops at its first failure. Passing round trips are only
+    printed individually when verbose is set.
+    """
     
     configs_to_test = [
         "ascii-yrja8-2",  # Default config
@@ -40,40 +49,43 @@ def test_round_trip_conversion():
         print(f"\n📋 Testing config: {config_name}")
         print("-" * 30)
         
-        system = H3SyllableSystem(config_name)
+        system = _get_system(config_name)
         config_passed = True
         
+        round_trips = []
+        
         for i, (lat, lon) in enumerate(test_coordinates, 1):
             try:
                 # Convert to syllable and back
                 address = system.coordinate_to_syllable(lat, lon)
                 result_lat, result_lon = system.syllable_to_coordinate(address)
-                
-                # Calculate error in meters
-                lat_rad = math.radians(lat)
-                meters_per_degree_lat = 111320
-                meters_per_degree_lon = 111320 * math.cos(lat_rad)
-                
-                distance_error = math.sqrt(
-                    ((result_lat - lat) * meters_per_degree_lat) ** 2 + 
-                    ((result_lon - lon) * meters_per_degree_lon) ** 2
-                )
-                
-                # Test passes if error < 1 meter
-                passed = distance_error < 1.0
-                
-                if passed:
-                    print(f"  ✅ Test {i}: {lat:.4f}, {lon:.4f} -> {address} -> {result_lat:.4f}, {result_lon:.4f} (error: {distance_error:.2f}m)")
-                else:
-                    print(f"  ❌ Test {i}: {lat:.4f}, {lon:.4f} -> {address} -> {result_lat:.4f}, {result_lon:.4f} (error: {distance_error:.2f}m)")
-                    config_passed = False
+                round_trips.append((i, lat, lon, address, result_lat, result_lon))
                     
             except Exception as e:
                 print(f"  ❌ Test {i}: FAILED with error: {e}")
                 config_passed = False
+                break
+        
+        # Calculate errors in meters for all round trips at once
+        distance_errors = [
+            haversine_distance(lat, lon, result_lat, result_lon) * 1000
+            for _, lat, lon, _, result_lat, result_lon in round_trips
+        ]
+        
+        for (i, lat, lon, address, result_lat, result_lon), distance_error in zip(round_trips, distance_errors):
+            # Test passes if error < 1 meter
+            passed = distance_error < 1.0
+            
+            if passed:
+                if verbose:
+                    print(f"  ✅ Test {i}: {lat:.4f}, {lon:.4f} -> {address} -> {result_lat:.4f}, {result_lon:.4f} (error: {distance_error:.2f}m)")
+            else:
+                print(f"  ❌ Test {i}: {lat:.4f}, {lon:.4f} -> {address} -> {result_lat:.4f}, {result_lon:.4f} (error: {distance_error:.2f}m)")
+                config_passed = False
+                break
         
         if config_passed:
-            print(f"  🎉 All tests passed for {config_name}")
+            print(f"  🎉 All {len(test_coordinates)} tests passed for {config_name}")
         else:
             print(f"  💥 Some tests failed for {config_name}")
     
@@ -86,44 +98,42 @@ def test_level_0_mapping():
     print("\n\n🗺️  Level 0 Hamiltonian Path Tests")
     print("=" * 50)
     
-    system = H3SyllableSystem("ascii-yrja8-2")
+    system = _get_system("ascii-yrja8-2")
     
     # Test that level 0 mapping is loaded
-    level_0_mapping = system._level_0_mapping
+    # Array where index = original base cell, value = Hamiltonian position
+    original_to_ham = system._level_0_mapping
     
-    if not level_0_mapping or not level_0_mapping.get("original_to_hamiltonian"):
+    if not original_to_ham:
         print("  ❌ Level 0 mapping not loaded!")
         return False
     
-    print(f"  ✅ Level 0 mapping loaded with {len(level_0_mapping['original_to_hamiltonian'])} mappings")
+    print(f"  ✅ Level 0 mapping loaded with {len(original_to_ham)} mappings")
     
     # Test that we have all 122 H3 level 0 cells
-    original_to_ham = level_0_mapping["original_to_hamiltonian"]
-    ham_to_original = level_0_mapping["hamiltonian_to_original"]
-    
-    if len(original_to_ham) != 122 or len(ham_to_original) != 122:
-        print(f"  ❌ Expected 122 mappings, got {len(original_to_ham)} and {len(ham_to_original)}")
+    if len(original_to_ham) != 122:
+        print(f"  ❌ Expected 122 mappings, got {len(original_to_ham)}")
         return False
     
     print("  ✅ All 122 H3 level 0 cells mapped")
     
-    # Test that mapping is bijective
-    for orig_cell, ham_cell in original_to_ham.items():
-        if ham_to_original.get(str(ham_cell)) != int(orig_cell):
-            print(f"  ❌ Mapping not bijective: {orig_cell} -> {ham_cell} -> {ham_to_original.get(str(ham_cell))}")
-            return False
+    # Test that mapping is bijective: the positions must be a permutation of 0-121
+    if sorted(original_to_ham) != list(range(122)):
+        missing = sorted(set(range(122)) - set(original_to_ham))
+        print(f"  ❌ Mapping not bijective: positions {missing} are never used")
+        return False
     
     print("  ✅ Mapping is bijective")
     
     # Test a few specific mappings from our known Hamiltonian path
     known_mappings = {
-        "4": 0,  # Start of Hamiltonian path
-        "0": 1,  # Second cell
-        "93": 121,  # End of Hamiltonian path
+        4: 0,  # Start of Hamiltonian path
+        0: 1,  # Second cell
+        93: 121,  # End of Hamiltonian path
     }
     
     for orig, expected_ham in known_mappings.items():
-        actual_ham = original_to_ham.get(orig)
+        actual_ham = original_to_ham[orig]
         if actual_ham != expected_ham:
             print(f"  ❌ Expected {orig} -> {expected_ham}, got {actual_ham}")
             return False
@@ -140,7 +150,7 @@ def test_address_validation():
     print("\n\n🔍 Address Validation Tests")
     print("=" * 50)
     
-    system = H3SyllableSystem("ascii-yrja8-2")
+    system = _get_system("ascii-yrja8-2")
     
     # Test valid addresses (create them from real coordinates)
     test_coords = [
@@ -188,7 +198,7 @@ def test_system_info():
     print("\n\n📊 System Information Tests")
     print("=" * 50)
     
-    system = H3SyllableSystem("ascii-yrja8-2")
+    system = _get_system("ascii-yrja8-2")
     info = system.get_system_info()
     
     print(f"  📋 Configuration: {system.config_name}")
@@ -6,21 +6,36 @@ Tests both coordinate -> syllable and syllable -> coordinate conversions
 to ensure perfect round-trip accuracy in both directions.
 """
 
-import sys
-import os
+import functools
 import random
-import math
-from pathlib import Path
+import re
+from concurrent.futures import ProcessPoolExecutor
 
 # Add package src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'packages', 'python', 'src'))
+import _bootstrap  # noqa: F401
 
 from h3_syllable.h3_syllable_system import H3SyllableSystem
 from h3_syllable.config_loader import list_configs
+from h3_syllable.utilities import haversine_distance
 
+from _validation_helpers import MAX_REPORTED_ERRORS, convert_all
 
-def generate_global_coordinates(count: int) -> list:
-    """Generate realistic global coordinates."""
+
+@functools.lru_cache(maxsize=None)
+def _get_system(config_name: str) -> H3SyllableSystem:
+    """Build each configuration's system once per process and reuse it."""
+    return H3SyllableSystem(config_name)
+
+
+# Separated addresses: two-character syllables joined by '-', groups joined by '|'
+SEPARATED_FORMAT = re.compile(r'[^|-]{2}(?:-[^|-]{2})*(?:\|[^|-]{2}(?:-[^|-]{2})*)*')
+
+
+def generate_global_coordinates(count: int, seed: int = None) -> list:
+    """Generate realistic global coordinates, reproducibly when a seed is given."""
+    rng = random.Random(seed)
+    uniform = rng.uniform
+    chance = rng.random
     coordinates = []
     
     # Add some fixed important locations
@@ -37,98 +52,115 @@ def generate_global_coordinates(count: int) -> list:
     
     coordinates.extend(important_locations)
     
-    # Add random coordinates
-    for _ in range(count - len(important_locations)):
-        # Use population-weighted distribution
-        if random.random() < 0.7:  # 70% in populated areas
-            lat = random.uniform(-60, 75)  # Most populated latitudes
-            lon = random.uniform(-180, 180)
-        else:  # 30% truly random
-            lat = random.uniform(-90, 90)
-            lon = random.uniform(-180, 180)
-        
-        coordinates.append((lat, lon))
+    # Add random coordinates, using a population-weighted distribution:
+    # 70% in the most populated latitudes, 30% truly random
+    coordinates.extend(
+        (uniform(-60, 75) if chance() < 0.7 else uniform(-90, 90), uniform(-180, 180))
+        for _ in range(count - len(important_locations))
+    )
     
     return coordinates
 
 
-def test_coordinate_to_syllable_validation(system: H3SyllableSystem, coordinates: list) -> dict:
-    """Test coordinate -> syllable conversion."""
+def round_trip_errors(round_trips: list) -> list:
+    """Return the great-circle error in meters of each (lat, lon, result_lat, result_lon, ...) round trip."""
+    return [
+        haversine_distance(lat, lon, result_lat, result_lon) * 1000
+        for lat, lon, result_lat, result_lon, *_ in round_trips
+    ]
+
+
+def record_error(results: dict, message: str, *args) -> None:
+    """Record an error, keeping only the first MAX_REPORTED_ERRORS and counting the rest."""
+    if len(results['errors']) < MAX_REPORTED_ERRORS:
+        results['errors'].append(message.format(*args))
+    else:
+        results['dropped_errors'] += 1
+
+
+def test_coordinate_to_syllable_validation(system: H3SyllableSystem, coordinates: list) -> tuple:
+    """
+    Test coordinate -> syllable conversion.
+    
+    Returns the results and the syllables (or conversion exception) for each
+    coordinate, so the reverse pass can reuse them.
+    """
     results = {
         'total_tests': len(coordinates),
-        'successful': 0,
-        'failed': 0,
-        'errors': []
+        'errors': [],
+        'dropped_errors': 0
     }
+    successful = 0
     
-    for i, (lat, lon) in enumerate(coordinates):
-        try:
-            syllable = system.coordinate_to_syllable(lat, lon)
-            results['successful'] += 1
-            
-            # Verify format
-            if '|' in syllable:
-                parts = syllable.split('|')
-                for part in parts:
-                    if not all(len(syl) == 2 for syl in part.split('-')):
-                        results['errors'].append(f"Invalid syllable format: {syllable}")
-                        results['failed'] += 1
-                        results['successful'] -= 1
-                        break
-            
-        except Exception as e:
-            results['failed'] += 1
-            results['errors'].append(f"Coordinate {lat}, {lon}: {str(e)}")
-            
-        if (i + 1) % 10000 == 0:
-            print(f"  Coordinate->Syllable: {i+1:,} / {len(coordinates):,} processed")
+    syllables = convert_all(
+        system.coordinates_to_addresses,
+        lambda coordinate: system.coordinate_to_address(*coordinate),
+        coordinates
+    )
     
-    return results
+    for (lat, lon), syllable in zip(coordinates, syllables):
+        if isinstance(syllable, Exception):
+            record_error(results, "Coordinate {}, {}: {}", lat, lon, syllable)
+        elif '|' in syllable and not SEPARATED_FORMAT.fullmatch(syllable):
+            # Separated addresses must keep their format
+            record_error(results, "Invalid syllable format: {}", syllable)
+        else:
+            successful += 1
+    
+    results['successful'] = successful
+    results['failed'] = len(coordinates) - successful
+    return results, syllables
 
 
-def test_syllable_to_coordinate_validation(system: H3SyllableSystem, coordinates: list) -> dict:
-    """Test syllable -> coordinate conversion."""
+def test_syllable_to_coordinate_validation(system: H3SyllableSystem, coordinates: list, syllables: list = None) -> dict:
+    """Test syllable -> coordinate conversion, reusing syllables from the forward pass if given."""
     results = {
         'total_tests': len(coordinates),
         'successful': 0,
         'failed': 0,
-        'errors': []
+        'errors': [],
+        'dropped_errors': 0
     }
     
-    for i, (lat, lon) in enumerate(coordinates):
-        try:
-            # First convert to syllable
-            syllable = system.coordinate_to_syllable(lat, lon)
-            
-            # Then convert back to coordinate
-            result_lat, result_lon = system.syllable_to_coordinate(syllable)
-            
-            # Verify accuracy
-            lat_diff = abs(result_lat - lat)
-            lon_diff = abs(result_lon - lon)
-            
-            # Calculate distance error
-            lat_rad = math.radians(lat)
-            meters_per_degree_lat = 111320
-            meters_per_degree_lon = 111320 * math.cos(lat_rad)
-            
-            distance_error = math.sqrt(
-                (lat_diff * meters_per_degree_lat) ** 2 + 
-                (lon_diff * meters_per_degree_lon) ** 2
-            )
-            
-            if distance_error > 1.0:  # More than 1 meter error
-                results['errors'].append(f"High precision error: {distance_error:.3f}m for {syllable}")
-                results['failed'] += 1
-            else:
-                results['successful'] += 1
-                
-        except Exception as e:
+    # First convert to syllables, unless the forward pass already did
+    if syllables is None:
+        syllables = convert_all(
+            system.coordinates_to_addresses,
+            lambda coordinate: system.coordinate_to_address(*coordinate),
+            coordinates
+        )
+    
+    converted = []
+    pending = []
+    for (lat, lon), syllable in zip(coordinates, syllables):
+        if isinstance(syllable, Exception):
+            results['failed'] += 1
+            record_error(results, "Syllable conversion failed for {}, {}: {}", lat, lon, syllable)
+        else:
+            pending.append((lat, lon, syllable))
+    
+    # Then convert back to coordinates
+    round_trips = convert_all(
+        system.addresses_to_coordinates,
+        system.address_to_coordinate,
+        [syllable for _, _, syllable in pending]
+    )
+    
+    for (lat, lon, syllable), result in zip(pending, round_trips):
+        if isinstance(result, Exception):
             results['failed'] += 1
-            results['errors'].append(f"Syllable conversion failed for {lat}, {lon}: {str(e)}")
-            
-        if (i + 1) % 10000 == 0:
-            print(f"  Syllable->Coordinate: {i+1:,} / {len(coordinates):,} processed")
+            record_error(results, "Syllable conversion failed for {}, {}: {}", lat, lon, result)
+        else:
+            converted.append((lat, lon, result[0], result[1], syllable))
+    
+    # Verify accuracy in one pass over all round trips
+    distance_errors = round_trip_errors(converted)
+    bad = [j for j, distance_error in enumerate(distance_errors) if distance_error > 1.0]  # More than 1 meter error
+    
+    for j in bad:
+        record_error(results, "High precision error: {:.3f}m for {}", distance_errors[j], converted[j][4])
+    results['failed'] += len(bad)
+    results['successful'] += len(converted) - len(bad)
     
     return results
 
@@ -155,12 +187,17 @@ def test_invalid_syllable_validation(system: H3SyllableSystem) -> dict:
     
     for syllable in invalid_syllables:
         results['total_tests'] += 1
+        if not system.is_valid_address(syllable):
+            results['successful'] += 1  # Expected to fail
+            continue
+        
+        # Only addresses that pass validation reach the decoder
         try:
-            system.syllable_to_coordinate(syllable)
-            results['failed'] += 1
+            system.address_to_coordinate(syllable)
             results['errors'].append(f"Invalid syllable '{syllable}' was accepted")
-        except Exception:
-            results['successful'] += 1  # Expected to fail
+        except Exception as e:
+            results['errors'].append(f"Valid syllable '{syllable}' failed to decode: {str(e)}")
+        results['failed'] += 1
     
     return results
 
@@ -170,18 +207,18 @@ def test_config_bidirectional_validation(config_name: str, coordinate_count: int
     print(f"\n🔄 Testing {config_name}")
     
     try:
-        system = H3SyllableSystem(config_name)
+        system = _get_system(config_name)
         
         # Generate test coordinates
         coordinates = generate_global_coordinates(coordinate_count)
         
         # Test coordinate -> syllable
         print(f"  📍 Testing coordinate -> syllable conversion...")
-        coord_results = test_coordinate_to_syllable_validation(system, coordinates)
+        coord_results, syllables = test_coordinate_to_syllable_validation(system, coordinates)
         
         # Test syllable -> coordinate  
         print(f"  🔤 Testing syllable -> coordinate conversion...")
-        syllable_results = test_syllable_to_coordinate_validation(system, coordinates)
+        syllable_results = test_syllable_to_coordinate_validation(system, coordinates, syllables)
         
         # Test invalid syllables
         print(f"  ❌ Testing invalid syllable validation...")
@@ -235,13 +272,17 @@ def main():
     print(f"📊 Testing {len(available_test_configs)} configurations with 1,000 coordinates each")
     print()
     
-    all_results = []
+    # Configurations are independent, so validate them in parallel processes
+    with ProcessPoolExecutor(max_workers=len(available_test_configs)) as executor:
+        all_results = list(executor.map(
+            test_config_bidirectional_validation,
+            available_test_configs,
+            [1000] * len(available_test_configs)
+        ))
+    
     successful_configs = 0
     
-    for config_name in available_test_configs:
-        result = test_config_bidirectional_validation(config_name, 1000)
-        all_results.append(result)
-        
+    for config_name, result in zip(available_test_configs, all_results):
         if result['success']:
             successful_configs += 1
             print(f"  ✅ {config_name}: PASSED")
@@ -266,12 +307,16 @@ def main():
                 print(f"    Coordinate->Syllable: {c2s['successful']}/{c2s['total_tests']} successful")
                 if c2s['errors']:
                     print(f"    First error: {c2s['errors'][0]}")
+                if c2s['dropped_errors']:
+                    print(f"    ({c2s['dropped_errors']} further errors not recorded)")
                     
             if 'syllable_to_coordinate' in result:
                 s2c = result['syllable_to_coordinate']
                 print(f"    Syllable->Coordinate: {s2c['successful']}/{s2c['total_tests']} successful")
                 if s2c['errors']:
                     print(f"    First error: {s2c['errors'][0]}")
+                if s2c['dropped_errors']:
+                    print(f"    ({s2c['dropped_errors']} further errors not recorded)")
     
     if successful_configs == len(available_test_configs):
         print(f"\n🎉 All bidirectional validation tests passed!")
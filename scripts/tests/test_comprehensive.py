@@ -6,22 +6,213 @@ Tests both Python and JavaScript packages with millions of random global coordin
 to validate full functionality and performance.
 """
 
-import sys
 import os
+import functools
 import json
 import random
 import time
 import math
 import subprocess
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Tuple, Dict
 
 # Add the package source to path
-package_src = Path(__file__).parent.parent.parent / "packages" / "python" / "src"
-sys.path.insert(0, str(package_src))
+from _bootstrap import package_src
 
 from h3_syllable.h3_syllable_system import H3SyllableSystem
 from h3_syllable.config_loader import list_configs
+from h3_syllable.utilities import haversine_distance
+
+from _json_io import loads_json
+from _validation_helpers import MAX_REPORTED_ERRORS, convert_all
+
+# Coordinates converted per batch call, with progress reported between chunks
+CHUNK_SIZE = 10000
+
+# Specific important locations, always at the start of the test coordinates
+IMPORTANT_LOCATIONS = (
+    (0.0, 0.0),           # Equator/Prime Meridian
+    (90.0, 0.0),          # North Pole
+    (-90.0, 0.0),         # South Pole
+    (48.8566, 2.3522),    # Paris
+    (40.7589, -73.9851),  # New York
+    (35.6762, 139.6503),  # Tokyo
+    (-33.8688, 151.2093), # Sydney
+    (55.7558, 37.6173),   # Moscow
+    (-22.9068, -43.1729), # Rio de Janeiro
+    (1.3521, 103.8198),   # Singapore
+)
+
+# Major population centers used for clustering random coordinates
+POPULATION_CENTERS = (
+    (40, -100),   # North America
+    (50, 10),     # Europe
+    (30, 110),    # Asia
+    (-20, 25),    # Africa
+    (-25, 140),   # Australia
+    (-10, -60),   # South America
+)
+
+# Fixed seed so failures at any scale reproduce across runs
+COORDINATE_SEED = 0xC0FFEE
+
+# Temporary JavaScript test runner and the coordinate data it reads
+JS_RUNNER_FILE = "temp_js_test.js"
+JS_COORDINATES_FILE = "temp_js_coordinates.bin"
+
+JS_RUNNER_SOURCE = '''
+const fs = require('fs');
+
+// Mock H3 Syllable System for JavaScript
+// This would be replaced with actual JavaScript implementation
+class H3SyllableSystem {
+    constructor(configName) {
+        this.configName = configName;
+        // Mock implementation
+    }
+    
+    coordinateToSyllable(lat, lon) {
+        // Mock conversion - would be actual implementation
+        return "mock-syllable-address";
+    }
+    
+    syllableToCoordinate(address) {
+        // Mock conversion - would be actual implementation
+        return [48.8566, 2.3522];
+    }
+}
+
+// Test coordinates: native-order doubles, (lat, lon) pairs. Copy into a
+// fresh buffer since Buffer views may not be 8-byte aligned.
+const values = new Float64Array(new Uint8Array(fs.readFileSync(process.argv[2])).buffer);
+
+const results = {
+    total_tests: 0,
+    passed_tests: 0,
+    failed_tests: 0,
+    errors: [],
+    performance: {},
+    mock_test: true
+};
+
+// Mock test - replace with actual implementation
+const system = new H3SyllableSystem("ascii-dlmst");
+
+for (let i = 0; i < values.length; i += 2) {
+    const lat = values[i];
+    const lon = values[i + 1];
+    try {
+        const address = system.coordinateToSyllable(lat, lon);
+        const [resultLat, resultLon] = system.syllableToCoordinate(address);
+        
+        results.total_tests++;
+        results.passed_tests++;  // Mock always passes
+    } catch (e) {
+        results.failed_tests++;
+        results.errors.push(e.message);
+    }
+}
+
+console.log(JSON.stringify(results));
+'''
+
+# Coordinates shared with config worker processes, set once per worker
+_worker_coordinates = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_system(config_name: str) -> H3SyllableSystem:
+    """Build each configuration's system once per process and reuse it."""
+    return H3SyllableSystem(config_name)
+
+
+def _calculate_distance_error(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate distance error in meters."""
+    return haversine_distance(lat1, lon1, lat2, lon2) * 1000
+
+
+def run_config_round_trips(config_name: str, coordinates: List[Tuple[float, float]]) -> Dict:
+    """Round-trip all coordinates through one configuration and summarize the errors."""
+    system = _get_system(config_name)
+    
+    start_time = time.time()
+    
+    errors = []
+    error_values = []
+    
+    # Forward and reverse conversion, batched one chunk at a time so a failing
+    # batch only falls back to single conversions for its own chunk
+    for start in range(0, len(coordinates), CHUNK_SIZE):
+        chunk = coordinates[start:start + CHUNK_SIZE]
+        
+        addresses = convert_all(
+            system.coordinates_to_addresses,
+            lambda coordinate: system.coordinate_to_address(*coordinate),
+            chunk
+        )
+        encoded = [(coordinate, address) for coordinate, address in zip(chunk, addresses)
+                   if not isinstance(address, Exception)]
+        round_trips = convert_all(
+            system.addresses_to_coordinates,
+            system.address_to_coordinate,
+            [address for _, address in encoded]
+        )
+        
+        for (lat, lon), address in zip(chunk, addresses):
+            if isinstance(address, Exception) and len(errors) < MAX_REPORTED_ERRORS:
+                errors.append("Exception at {:.4f}, {:.4f}: {}".format(lat, lon, address))
+        
+        for ((lat, lon), _), result in zip(encoded, round_trips):
+            if isinstance(result, Exception):
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append("Exception at {:.4f}, {:.4f}: {}".format(lat, lon, result))
+                continue
+            
+            # Calculate error
+            error_meters = _calculate_distance_error(lat, lon, result[0], result[1])
+            error_values.append(error_meters)
+            
+            # Test passes if error < 1 meter
+            if error_meters >= 1.0 and len(errors) < MAX_REPORTED_ERRORS:
+                errors.append("High error: {:.2f}m at {:.4f}, {:.4f}".format(error_meters, lat, lon))
+        
+        # Progress indicator, between chunks
+        if len(coordinates) > CHUNK_SIZE:
+            print(f"     {config_name} progress: {start + len(chunk):,}/{len(coordinates):,}")
+    
+    end_time = time.time()
+    
+    passed = sum(1 for error_meters in error_values if error_meters < 1.0)
+    
+    return {
+        'total': len(coordinates),
+        'passed': passed,
+        'failed': len(coordinates) - passed,
+        'errors': errors,
+        'avg_error_meters': sum(error_values) / len(coordinates) if coordinates else 0,
+        'max_error_meters': max(error_values, default=0),
+        'conversion_time': end_time - start_time
+    }
+
+
+def _init_config_worker(coordinates: List[Tuple[float, float]]):
+    """Process pool initializer: keep the shared coordinates for this worker."""
+    global _worker_coordinates
+    _worker_coordinates = coordinates
+
+
+def _run_config(config_name: str, num_coordinates: int):
+    """
+    Process pool entry point: run one configuration on the first
+    num_coordinates shared coordinates, returning the error instead of raising.
+    """
+    try:
+        return run_config_round_trips(config_name, _worker_coordinates[:num_coordinates])
+    except Exception as e:
+        return e
 
 
 class ComprehensiveTestSuite:
@@ -39,6 +230,14 @@ class ComprehensiveTestSuite:
         # JavaScript package path
         self.js_package_path = Path(__file__).parent.parent.parent / "packages" / "javascript"
         
+        # Configuration worker pool and the coordinates its workers hold;
+        # kept across scales so each worker reuses the systems it built
+        self._config_executor = None
+        self._config_coordinates = None
+        
+        # JavaScript runner script, written on first use and kept for the whole run
+        self._js_runner_path = None
+        
         print(f"🧪 Comprehensive H3 Syllable System Test Suite")
         print(f"=" * 60)
         print(f"Selected {len(self.test_configs)} configurations for testing")
@@ -67,59 +266,44 @@ class ComprehensiveTestSuite:
             alphabet_configs.extend([c for c in all_configs if c.startswith(alphabet)][:1])
         selected.extend(alphabet_configs)
         
-        # Remove duplicates and limit to reasonable number
-        selected = list(set(selected))[:8]
+        # Remove duplicates (keeping selection order) and limit to reasonable number
+        selected = list(dict.fromkeys(selected))[:8]
         
         return selected
     
-    def generate_test_coordinates(self, num_coordinates: int) -> List[Tuple[float, float]]:
-        """Generate diverse test coordinates across the globe."""
-        coordinates = []
-        
-        # Add specific important locations
-        important_locations = [
-            (0.0, 0.0),           # Equator/Prime Meridian
-            (90.0, 0.0),          # North Pole
-            (-90.0, 0.0),         # South Pole
-            (48.8566, 2.3522),    # Paris
-            (40.7589, -73.9851),  # New York
-            (35.6762, 139.6503),  # Tokyo
-            (-33.8688, 151.2093), # Sydney
-            (55.7558, 37.6173),   # Moscow
-            (-22.9068, -43.1729), # Rio de Janeiro
-            (1.3521, 103.8198),   # Singapore
-        ]
-        
-        coordinates.extend(important_locations)
+    def generate_test_coordinates(self, num_coordinates: int, seed: int = None) -> List[Tuple[float, float]]:
+        """Generate diverse test coordinates across the globe, reproducibly when a seed is given."""
+        rng = random.Random(seed)
+        # random() is the C-level draw; uniform() adds a Python call per sample
+        rand = rng.random
+        degrees = math.degrees
+        asin = math.asin
+        centers = POPULATION_CENTERS
+        num_centers = len(centers)
+        
+        # Start with the specific important locations
+        coordinates = list(IMPORTANT_LOCATIONS)
         
         # Add random coordinates with geographic distribution
-        remaining = num_coordinates - len(important_locations)
+        remaining = num_coordinates - len(IMPORTANT_LOCATIONS)
+        append = coordinates.append
         
         for _ in range(remaining):
-            # Use more realistic latitude distribution (less density at poles)
-            lat = math.degrees(math.asin(random.uniform(-1, 1)))
-            lon = random.uniform(-180, 180)
-            
             # Add some clustering around populated areas
-            if random.random() < 0.3:  # 30% chance of populated area
-                # Cluster around major population centers
-                centers = [
-                    (40, -100),   # North America
-                    (50, 10),     # Europe
-                    (30, 110),    # Asia
-                    (-20, 25),    # Africa
-                    (-25, 140),   # Australia
-                    (-10, -60),   # South America
-                ]
-                center_lat, center_lon = random.choice(centers)
-                lat = center_lat + random.uniform(-20, 20)
-                lon = center_lon + random.uniform(-30, 30)
+            if rand() < 0.3:  # 30% chance of populated area
+                center_lat, center_lon = centers[int(rand() * num_centers)]
+                lat = center_lat + 40.0 * rand() - 20.0
+                lon = center_lon + 60.0 * rand() - 30.0
                 
                 # Keep within bounds
                 lat = max(-90, min(90, lat))
                 lon = ((lon + 180) % 360) - 180
+            else:
+                # Use more realistic latitude distribution (less density at poles)
+                lat = degrees(asin(2.0 * rand() - 1.0))
+                lon = 360.0 * rand() - 180.0
             
-            coordinates.append((lat, lon))
+            append((lat, lon))
         
         return coordinates
     
@@ -138,85 +322,70 @@ class ComprehensiveTestSuite:
             'config_results': {}
         }
         
-        for config_name in self.test_configs:
+        # Configurations are independent and run in worker processes; reuse
+        # the running pool when its coordinates start with these ones
+        pool_coordinates = self._config_coordinates
+        if pool_coordinates is None or pool_coordinates[:len(coordinates)] != coordinates:
+            self.start_config_workers(coordinates)
+        
+        config_runs = self._config_executor.map(_run_config, self.test_configs, repeat(len(coordinates)))
+        for config_name, config_results in zip(self.test_configs, config_runs):
             print(f"   Testing {config_name}...")
             
-            config_results = {
-                'total': 0,
-                'passed': 0,
-                'failed': 0,
-                'errors': [],
-                'avg_error_meters': 0,
-                'max_error_meters': 0,
-                'conversion_time': 0
-            }
+            if isinstance(config_results, Exception):
+                print(f"     ❌ Configuration failed: {config_results}")
+                results['errors'].append(f"Config {config_name} failed: {config_results}")
+                continue
             
-            try:
-                system = H3SyllableSystem(config_name)
-                
-                start_time = time.time()
-                total_error = 0
-                max_error = 0
-                
-                for i, (lat, lon) in enumerate(coordinates):
-                    try:
-                        # Forward conversion
-                        address = system.coordinate_to_syllable(lat, lon)
-                        
-                        # Reverse conversion
-                        result_lat, result_lon = system.syllable_to_coordinate(address)
-                        
-                        # Calculate error
-                        error_meters = self._calculate_distance_error(lat, lon, result_lat, result_lon)
-                        total_error += error_meters
-                        max_error = max(max_error, error_meters)
-                        
-                        # Test passes if error < 1 meter
-                        if error_meters < 1.0:
-                            config_results['passed'] += 1
-                        else:
-                            config_results['failed'] += 1
-                            config_results['errors'].append(f"High error: {error_meters:.2f}m at {lat:.4f}, {lon:.4f}")
-                        
-                        config_results['total'] += 1
-                        
-                        # Progress indicator
-                        if (i + 1) % 10000 == 0:
-                            print(f"     Progress: {i+1:,}/{len(coordinates):,}")
-                        
-                    except Exception as e:
-                        config_results['failed'] += 1
-                        config_results['errors'].append(f"Exception at {lat:.4f}, {lon:.4f}: {e}")
-                        config_results['total'] += 1
-                
-                end_time = time.time()
-                
-                config_results['conversion_time'] = end_time - start_time
-                config_results['avg_error_meters'] = total_error / len(coordinates) if coordinates else 0
-                config_results['max_error_meters'] = max_error
-                
-                results['config_results'][config_name] = config_results
-                results['total_tests'] += config_results['total']
-                results['passed_tests'] += config_results['passed']
-                results['failed_tests'] += config_results['failed']
-                results['errors'].extend(config_results['errors'][:5])  # Keep first 5 errors
-                
-                print(f"     ✅ {config_results['passed']:,}/{config_results['total']:,} passed")
-                print(f"     ⏱️  {config_results['conversion_time']:.2f}s total")
-                print(f"     📊 Avg error: {config_results['avg_error_meters']:.3f}m")
-                
-            except Exception as e:
-                print(f"     ❌ Configuration failed: {e}")
-                results['errors'].append(f"Config {config_name} failed: {e}")
+            results['config_results'][config_name] = config_results
+            results['total_tests'] += config_results['total']
+            results['passed_tests'] += config_results['passed']
+            results['failed_tests'] += config_results['failed']
+            results['errors'].extend(config_results['errors'][:5])  # Keep first 5 errors
+            
+            print(f"     ✅ {config_results['passed']:,}/{config_results['total']:,} passed")
+            print(f"     ⏱️  {config_results['conversion_time']:.2f}s total")
+            print(f"     📊 Avg error: {config_results['avg_error_meters']:.3f}m")
         
         return results
     
+    def start_config_workers(self, coordinates: List[Tuple[float, float]]):
+        """
+        Start the configuration worker pool, replacing any running one.
+        
+        Each worker receives the coordinates once, through the pool
+        initializer. Later runs on a prefix of these coordinates reuse the
+        same workers, and with them the systems each worker has built.
+        """
+        self.close_config_workers()
+        max_workers = max(1, min(len(self.test_configs), os.cpu_count() or 1))
+        self._config_executor = ProcessPoolExecutor(max_workers=max_workers,
+                                                    initializer=_init_config_worker,
+                                                    initargs=(coordinates,))
+        self._config_coordinates = coordinates
+    
+    def close_config_workers(self):
+        """Shut down the configuration worker pool, if one is running."""
+        if self._config_executor is not None:
+            self._config_executor.shutdown()
+            self._config_executor = None
+            self._config_coordinates = None
+    
     def test_javascript_package(self, coordinates: List[Tuple[float, float]]) -> Dict:
         """Test the JavaScript package with given coordinates."""
+        return self._collect_javascript_results(*self._start_javascript_tests(coordinates))
+    
+    def _start_javascript_tests(self, coordinates: List[Tuple[float, float]]) -> Tuple[Dict, subprocess.Popen]:
+        """
+        Launch the JavaScript tests without waiting for them.
+        
+        Returns the results dict and the running node process, or None when
+        the tests could not be started (the reason is in the results).
+        """
         print(f"🟨 Testing JavaScript Package")
         
         # Create test script for JavaScript
-        test_script = self._create_js_test_script(coordinates)
+        test_args = self._create_js_test_script(coordinates)
         
         results = {
             'total_tests': 0,
@@ -231,18 +400,34 @@ class ComprehensiveTestSuite:
             # Check if Node.js is available
             subprocess.run(['node', '--version'], capture_output=True, check=True)
             
-            # Run the JavaScript test
-            result = subprocess.run(
-                ['node', test_script],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
+            # Run the JavaScript test (raw bytes, parsed without decoding first)
+            return results, subprocess.Popen(
+                ['node', *test_args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
             )
+        
+        except FileNotFoundError:
+            results['errors'].append("Node.js not found")
+            print(f"   ⚠️  Node.js not available, skipping JavaScript tests")
+        except Exception as e:
+            results['errors'].append(f"JavaScript test error: {e}")
+            print(f"   ❌ JavaScript test error: {e}")
+        
+        return results, None
+    
+    def _collect_javascript_results(self, results: Dict, process: subprocess.Popen) -> Dict:
+        """Wait for a launched JavaScript test run and parse its results."""
+        if process is None:
+            return results
+        
+        try:
+            stdout, stderr = process.communicate(timeout=300)  # 5 minute timeout
             
-            if result.returncode == 0:
+            if process.returncode == 0:
                 # Parse results from stdout
                 try:
-                    js_results = json.loads(result.stdout)
+                    js_results = loads_json(stdout)
                     results.update(js_results)
                     results['available'] = True
                     print(f"   ✅ JavaScript tests completed")
@@ -250,117 +435,77 @@ class ComprehensiveTestSuite:
                     results['errors'].append("Failed to parse JavaScript test results")
                     print(f"   ❌ Failed to parse JavaScript results")
             else:
-                results['errors'].append(f"JavaScript test failed: {result.stderr}")
+                results['errors'].append(f"JavaScript test failed: {stderr.decode('utf-8', 'replace')}")
                 print(f"   ❌ JavaScript test execution failed")
         
         except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
             results['errors'].append("JavaScript test timed out")
             print(f"   ⏱️  JavaScript test timed out")
-        except FileNotFoundError:
-            results['errors'].append("Node.js not found")
-            print(f"   ⚠️  Node.js not available, skipping JavaScript tests")
         except Exception as e:
             results['errors'].append(f"JavaScript test error: {e}")
             print(f"   ❌ JavaScript test error: {e}")
         
         return results
     
-    def _create_js_test_script(self, coordinates: List[Tuple[float, float]]) -> str:
-        """Create JavaScript test script."""
-        script_path = Path(__file__).parent / "temp_js_test.js"
-        
-        # Create a simple test script
-        test_code = f'''
-const fs = require('fs');
-const path = require('path');
-
-// Mock H3 Syllable System for JavaScript
-// This would be replaced with actual JavaScript implementation
-class H3SyllableSystem {{
-    constructor(configName) {{
-        this.configName = configName;
-        // Mock implementation
-    }}
-    
-    coordinateToSyllable(lat, lon) {{
-        // Mock conversion - would be actual implementation
-        return "mock-syllable-address";
-    }}
-    
-    syllableToCoordinate(address) {{
-        // Mock conversion - would be actual implementation
-        return [48.8566, 2.3522];
-    }}
-}}
-
-// Test coordinates
-const coordinates = {json.dumps(coordinates[:1000])};  // Limit for JavaScript test
-
-const results = {{
-    total_tests: 0,
-    passed_tests: 0,
-    failed_tests: 0,
-    errors: [],
-    performance: {{}},
-    mock_test: true
-}};
-
-// Mock test - replace with actual implementation
-const system = new H3SyllableSystem("ascii-dlmst");
-
-coordinates.forEach(([lat, lon]) => {{
-    try {{
-        const address = system.coordinateToSyllable(lat, lon);
-        const [resultLat, resultLon] = system.syllableToCoordinate(address);
-        
-        results.total_tests++;
-        results.passed_tests++;  // Mock always passes
-    }} catch (e) {{
-        results.failed_tests++;
-        results.errors.push(e.message);
-    }}
-}});
-
-console.log(JSON.stringify(results));
-'''
-        
-        with open(script_path, 'w') as f:
-            f.write(test_code)
-        
-        return str(script_path)
+    def _create_js_test_script(self, coordinates: List[Tuple[float, float]]) -> List[str]:
+        """
+        Write the JavaScript test runner and its coordinate data.
+        
+        The runner is fixed source; coordinates go to a binary file of
+        native-order doubles (lat, lon pairs) passed on the command line.
+        
+        Returns the node arguments: runner script path and data file path.
+        """
+        data_path = Path(__file__).parent / JS_COORDINATES_FILE
+        
+        # Always write the runner on first use, replacing any file left by an
+        # interrupted or older run; later scales reuse it until close()
+        if self._js_runner_path is None:
+            script_path = Path(__file__).parent / JS_RUNNER_FILE
+            script_path.write_text(JS_RUNNER_SOURCE)
+            self._js_runner_path = script_path
+        
+        # Limit for JavaScript test
+        values = array('d')
+        for lat, lon in coordinates[:1000]:
+            values.append(lat)
+            values.append(lon)
+        data_path.write_bytes(values.tobytes())
+        
+        return [str(self._js_runner_path), str(data_path)]
     
-    def _calculate_distance_error(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance error in meters."""
-        lat_rad = math.radians(lat1)
-        meters_per_degree_lat = 111320
-        meters_per_degree_lon = 111320 * math.cos(lat_rad)
-        
-        lat_diff = lat2 - lat1
-        lon_diff = lon2 - lon1
-        
-        distance_error = math.sqrt(
-            (lat_diff * meters_per_degree_lat) ** 2 + 
-            (lon_diff * meters_per_degree_lon) ** 2
-        )
-        
-        return distance_error
-    
-    def run_comprehensive_tests(self, num_coordinates: int = 100000):
-        """Run comprehensive tests with specified number of coordinates."""
+    def run_comprehensive_tests(self, num_coordinates: int = 100000,
+                                coordinates: List[Tuple[float, float]] = None):
+        """
+        Run comprehensive tests with specified number of coordinates.
+        
+        When a prebuilt coordinate list is given, its first num_coordinates
+        entries are used (the important locations always lead the list).
+        """
         print(f"🚀 Starting comprehensive tests with {num_coordinates:,} coordinates")
         print()
         
-        # Generate test coordinates
-        print("🌍 Generating test coordinates...")
-        coordinates = self.generate_test_coordinates(num_coordinates)
-        print(f"   Generated {len(coordinates):,} coordinates")
+        # Generate test coordinates, unless a larger set was prebuilt
+        if coordinates is None:
+            print("🌍 Generating test coordinates...")
+            coordinates = self.generate_test_coordinates(num_coordinates)
+            print(f"   Generated {len(coordinates):,} coordinates")
+        else:
+            coordinates = coordinates[:num_coordinates]
+            print(f"🌍 Using {len(coordinates):,} prebuilt coordinates")
         print()
         
+        # Start the JavaScript package tests first: node runs as its own
+        # process alongside the Python tests and is collected afterwards
+        javascript_run = self._start_javascript_tests(coordinates)
+        
         # Test Python package
         python_results = self.test_python_package(coordinates)
         
         # Test JavaScript package
-        javascript_results = self.test_javascript_package(coordinates)
+        javascript_results = self._collect_javascript_results(*javascript_run)
         
         # Generate comprehensive report
         self._generate_report(python_results, javascript_results, coordinates)
@@ -426,10 +571,19 @@ console.log(JSON.stringify(results));
             print(f"❌ POOR: {overall_success:.2f}% success rate - needs investigation")
     
     def _cleanup(self):
-        """Clean up temporary files."""
-        temp_file = Path(__file__).parent / "temp_js_test.js"
+        """Clean up the temporary files of one test run."""
+        temp_file = Path(__file__).parent / JS_COORDINATES_FILE
         if temp_file.exists():
             temp_file.unlink()
+    
+    def close(self):
+        """Release resources kept across test runs: worker pool and JavaScript runner."""
+        self.close_config_workers()
+        
+        if self._js_runner_path is not None:
+            if self._js_runner_path.exists():
+                self._js_runner_path.unlink()
+            self._js_runner_path = None
 
 
 def main():
@@ -444,11 +598,20 @@ def main():
         # (1000000, "Full scale test")  # Uncomment for full scale
     ]
     
-    for num_coords, description in test_scales:
-        print(f"\n🧪 {description} ({num_coords:,} coordinates)")
-        print("=" * 60)
-        suite.run_comprehensive_tests(num_coords)
-        print()
+    # Generate the largest scale once; smaller scales use its prefix
+    all_coordinates = suite.generate_test_coordinates(max(num_coords for num_coords, _ in test_scales),
+                                                      seed=COORDINATE_SEED)
+    
+    # One worker pool for all scales, so per-worker systems are built once
+    suite.start_config_workers(all_coordinates)
+    try:
+        for num_coords, description in test_scales:
+            print(f"\n🧪 {description} ({num_coords:,} coordinates)")
+            print("=" * 60)
+            suite.run_comprehensive_tests(num_coords, all_coordinates)
+            print()
+    finally:
+        suite.close()
 
 
 if __name__ == "__main__":